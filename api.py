@@ -3,32 +3,85 @@ api.py — FastAPI backend for the PaperCast React frontend.
 
 Provides REST endpoints for:
   • POST /api/generate   → start pipeline (SSE stream for progress)
-  • GET  /api/audio/{filename} → serve generated audio
-  • GET  /api/transcript  → return the latest transcript
+  • GET  /api/audio/{job_id}/{filename} → serve generated audio
+  • GET  /api/transcript/{job_id} → stream a job's transcript
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
+import re
+import shutil
 import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException
+import anyio
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-import config
+from config import settings
 from src.pipeline import run_pipeline
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="PaperCast API", version="1.0.0")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Bounded worker pool — extra jobs wait in "pending" instead of each
+    # spawning its own pipeline (and LLM client / TTS model) at once.
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=settings.PIPELINE_WORKERS, thread_name_prefix="papercast",
+    )
+    yield
+    app.state.executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(title="PaperCast API", version="1.0.0", lifespan=_lifespan)
+
+
+class _CompressText:
+    """
+    GZip JSON / transcript responses, but pass audio and SSE straight
+    through: audio is range-served via zero-copy send, and older Starlette
+    releases would buffer an event stream inside the gzip wrapper.
+
+    Compressed routes have the zero-copy extension hidden from them, so
+    ``ZeroCopyFileResponse`` falls back to body chunks gzip can rewrite.
+    """
+
+    _PASSTHROUGH_PREFIXES = ("/api/audio/", "/api/stream/")
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self._PASSTHROUGH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopysend" in extensions:
+            extensions = {k: v for k, v in extensions.items() if k != "http.response.zerocopysend"}
+            scope = {**scope, "extensions": extensions}
+        await self.gzip(scope, receive, send)
+
+
+app.add_middleware(_CompressText, minimum_size=1024)
 
 # Allow the Vite dev server to talk to us
 app.add_middleware(
@@ -42,19 +95,150 @@ app.add_middleware(
 # ── In-memory job store ──────────────────────────────────────────────
 
 class Job:
-    def __init__(self, job_id: str, arxiv_url: str, llm: str, tts: str, gen_audio: bool):
+    def __init__(
+        self,
+        job_id: str,
+        arxiv_url: str,
+        llm: str,
+        tts: str,
+        gen_audio: bool,
+        loop: asyncio.AbstractEventLoop,
+    ):
         self.id = job_id
         self.arxiv_url = arxiv_url
         self.llm = llm
         self.tts = tts
         self.gen_audio = gen_audio
+        # Each job writes its transcript and audio into its own directory,
+        # so concurrent and later runs never overwrite each other's files.
+        self.output_dir: Path = settings.OUTPUT_DIR / job_id
         self.status: str = "pending"       # pending | running | done | error
         self.progress: float = 0.0
         self.message: str = ""
         self.error: Optional[str] = None
         self.result: Optional[dict] = None
+        self.finished_at: Optional[float] = None   # time.monotonic() at done/error
+        # Built once by the worker when the job reaches a terminal state
+        self.final_status: Optional[dict] = None
+        self.final_frame: Optional[bytes] = None
+        # Output locations, resolved (one stat each) when the job finishes
+        self.transcript_path: Optional[Path] = None
+        self.audio_name: Optional[str] = None
+        # Bumped on every state change; SSE streams wait on the condition
+        # instead of polling the fields above.
+        self.version: int = 0
+        self._loop = loop
+        self._cond = asyncio.Condition()
+
+    def publish(self) -> None:
+        """Record a state change and wake every stream (thread-safe)."""
+        self.version += 1
+        asyncio.run_coroutine_threadsafe(self._notify(), self._loop)
+
+    async def _notify(self) -> None:
+        async with self._cond:
+            self._cond.notify_all()
+
+    async def wait_for_update(self, last_version: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until ``version`` moves past *last_version*.  Returns False if
+        *timeout* seconds pass first.
+        """
+        async with self._cond:
+            try:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: self.version != last_version), timeout,
+                )
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+
+def _discard_output(job: Job) -> None:
+    """Delete a dropped job's output directory; its URLs are gone with it."""
+    shutil.rmtree(job.output_dir, ignore_errors=True)
+
+
+class JobStore:
+    """
+    Bounded LRU of jobs.  Inserting past ``max_size`` drops the least
+    recently used *finished* job, and a daemon thread evicts finished
+    jobs once they are older than ``ttl_seconds``.  Pending and running
+    jobs are never evicted.  Output directories of dropped jobs are
+    deleted by that thread, outside the lock and off the event loop.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, sweep_interval: float = 60.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.RLock()
+        self._dropped: list[Job] = []   # evicted, output not yet deleted
+        self._wake = threading.Event()
+        sweeper = threading.Thread(
+            target=self._sweep_forever, args=(sweep_interval,), daemon=True,
+        )
+        sweeper.start()
+
+    def put(self, job: Job) -> bool:
+        """
+        Store *job*, making room by evicting finished jobs.  Returns False
+        (and stores nothing) when every slot holds a job still in progress.
+        """
+        with self._lock:
+            while len(self._jobs) >= self.max_size:
+                evicted = next(
+                    (j for j in self._jobs.values() if j.finished_at is not None), None,
+                )
+                if evicted is None:
+                    return False
+                del self._jobs[evicted.id]
+                self._dropped.append(evicted)
+                self._wake.set()
+                logger.info("Evicted job %s (store full)", evicted.id)
+            self._jobs[job.id] = job
+            self._jobs.move_to_end(job.id)
+            return True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs.move_to_end(job_id)
+            return job
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def active_count(self) -> int:
+        """Number of jobs still pending or running."""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.finished_at is None)
+
+    def sweep(self) -> None:
+        """Drop finished jobs whose TTL has elapsed and delete dropped output."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < cutoff
+            ]
+            dropped = self._dropped + [self._jobs.pop(job_id) for job_id in expired]
+            self._dropped = []
+        for job in dropped:
+            _discard_output(job)
+        if expired:
+            logger.info("Evicted %d expired job(s)", len(expired))
+
+    def _sweep_forever(self, interval: float) -> None:
+        while True:
+            # Woken early when put() drops a job, to delete its output
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.sweep()
 
-_jobs: dict[str, Job] = {}
+
+_jobs = JobStore(max_size=settings.JOB_STORE_MAX_SIZE, ttl_seconds=settings.JOB_TTL_SECONDS)
 
 
 # ── Request / Response models ────────────────────────────────────────
@@ -75,20 +259,155 @@ class JobStatus(BaseModel):
     title: Optional[str] = None
     authors: Optional[str] = None
     abstract: Optional[str] = None
-    transcript: Optional[str] = None
+    summary: Optional[str] = None
+    transcript_url: Optional[str] = None
     audio_url: Optional[str] = None
 
 
+# ── Zero-copy file response ──────────────────────────────────────────
+
+_RANGE_RE = re.compile(r"bytes=\s*(\d*)-(\d*)\s*$")
+
+
+class ZeroCopyFileResponse(Response):
+    """
+    Serve a file through the server's ``sendfile(2)`` when it supports the
+    ASGI ``http.response.zerocopysend`` extension, falling back to chunked
+    async reads otherwise.  A single ``Range`` (``start-end``, ``start-`` or
+    suffix ``-length``) is honoured; multi-range requests get the full body.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: Path,
+        media_type: str,
+        filename: Optional[str] = None,
+        range_header: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        stat_result: Optional[os.stat_result] = None,
+    ):
+        self.path = path
+        self.media_type = media_type
+        self.background = None
+        self.status_code = 200
+
+        size = (stat_result or path.stat()).st_size
+        self.offset, self.count = 0, size
+        headers = {**(headers or {}), "accept-ranges": "bytes"}
+        if filename:
+            headers["content-disposition"] = f'attachment; filename="{filename}"'
+
+        match = _RANGE_RE.match(range_header or "")
+        first, last = match.groups() if match else ("", "")
+        if first and last and int(last) < int(first):
+            first = last = ""  # invalid rather than unsatisfiable: ignore it
+        if first or last:
+            if not first:
+                # Suffix range: the final `last` bytes (``-0`` is unsatisfiable)
+                start, end = size - min(int(last), size), size - 1
+            else:
+                start = int(first)
+                end = min(int(last or size - 1), size - 1)
+            if start > end or start >= size:
+                self.status_code = 416
+                self.count = 0
+                headers["content-range"] = f"bytes */{size}"
+            else:
+                self.status_code = 206
+                self.offset, self.count = start, end - start + 1
+                headers["content-range"] = f"bytes {start}-{end}/{size}"
+
+        headers["content-length"] = str(self.count)
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if self.count == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if "http.response.zerocopysend" in scope.get("extensions", {}):
+            with open(self.path, "rb") as fh:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": fh,
+                    "offset": self.offset,
+                    "count": self.count,
+                    "more_body": False,
+                })
+            return
+
+        remaining = self.count
+        async with await anyio.open_file(self.path, "rb") as fh:
+            await fh.seek(self.offset)
+            while remaining > 0:
+                chunk = await fh.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+        if remaining > 0:
+            # File shrank underneath us — close the body cleanly
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
 # ── Worker ───────────────────────────────────────────────────────────
 
+
+def _sse_frame(payload: dict) -> bytes:
+    """Encode *payload* as a compact SSE ``data:`` frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def _finalize(job: Job) -> None:
+    """
+    Build the terminal status payload and SSE frame exactly once, so
+    status polls and streams never touch the disk or re-encode.
+    """
+    final = {"status": job.status, "progress": job.progress, "message": job.message}
+    if job.result:
+        paper = job.result["paper"]
+        final["title"] = paper.title
+        final["authors"] = paper.authors
+        final["abstract"] = paper.abstract
+        final["summary"] = job.result["script"].summary
+        # The transcript body is fetched once from its own endpoint rather
+        # than JSON-escaped into every status payload.
+        tp = Path(job.result["transcript_path"])
+        if tp.exists():
+            job.transcript_path = tp
+            final["transcript_url"] = f"/api/transcript/{job.id}"
+        ap = job.result.get("audio_path")
+        if ap and Path(ap).exists():
+            job.audio_name = Path(ap).name
+            final["audio_url"] = f"/api/audio/{job.id}/{job.audio_name}"
+    if job.error:
+        final["error"] = job.error
+
+    job.final_status = {"job_id": job.id, "error": job.error, **final}
+    job.final_frame = _sse_frame(final)
+
+
 def _run_job(job: Job):
     """Run the pipeline in a background thread."""
     job.status = "running"
     job.message = "Starting pipeline…"
+    job.publish()
 
     def _progress(msg: str, frac: float):
         job.message = msg
         job.progress = frac
+        job.publish()
 
     try:
         result = run_pipeline(
@@ -96,6 +415,7 @@ def _run_job(job: Job):
             llm_backend=job.llm,
             tts_engine=job.tts,
             generate_audio_flag=job.gen_audio,
+            output_dir=job.output_dir,
             progress_callback=_progress,
         )
         job.result = result
@@ -107,104 +427,172 @@ def _run_job(job: Job):
         job.status = "error"
         job.error = str(exc)
         job.message = f"Error: {exc}"
+    finally:
+        _finalize(job)
+        job.finished_at = time.monotonic()
+        job.publish()
 
 
 # ── Endpoints ────────────────────────────────────────────────────────
 
 @app.post("/api/generate")
-def start_generation(req: GenerateRequest):
+async def start_generation(req: GenerateRequest):
     """Kick off a pipeline run and return a job ID."""
+    if _jobs.active_count() >= settings.MAX_QUEUED_JOBS:
+        raise HTTPException(503, "Too many jobs in progress, try again later")
+
     job_id = uuid.uuid4().hex[:12]
-    job = Job(job_id, req.arxiv_url, req.llm_backend, req.tts_engine, req.generate_audio)
-    _jobs[job_id] = job
-    thread = threading.Thread(target=_run_job, args=(job,), daemon=True)
-    thread.start()
+    job = Job(
+        job_id, req.arxiv_url, req.llm_backend, req.tts_engine, req.generate_audio,
+        loop=asyncio.get_running_loop(),
+    )
+    if not _jobs.put(job):
+        raise HTTPException(503, "Too many jobs in progress, try again later")
+    app.state.executor.submit(_run_job, job)
     return {"job_id": job_id}
 
 
-@app.get("/api/status/{job_id}")
-def get_status(job_id: str):
+@app.get(
+    "/api/status/{job_id}",
+    response_model=JobStatus,
+    response_model_exclude_none=True,
+)
+async def get_status(job_id: str):
     """Poll the status of a running job."""
     job = _jobs.get(job_id)
     if not job:
         raise HTTPException(404, "Job not found")
 
-    resp = JobStatus(
-        job_id=job.id,
-        status=job.status,
-        progress=job.progress,
-        message=job.message,
-        error=job.error,
-    )
-
-    if job.result:
-        paper = job.result["paper"]
-        resp.title = paper.title
-        resp.authors = paper.authors
-        resp.abstract = paper.abstract
-        transcript_path: Path = job.result["transcript_path"]
-        if transcript_path.exists():
-            resp.transcript = transcript_path.read_text(encoding="utf-8")
-        audio_path = job.result.get("audio_path")
-        if audio_path and Path(audio_path).exists():
-            resp.audio_url = f"/api/audio/{Path(audio_path).name}"
+    if job.final_status is not None:
+        return job.final_status
 
-    return resp
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+    }
 
 
 @app.get("/api/stream/{job_id}")
-def stream_status(job_id: str):
+async def stream_status(job_id: str, request: Request):
     """SSE stream of job progress for real-time UI updates."""
     job = _jobs.get(job_id)
     if not job:
         raise HTTPException(404, "Job not found")
 
-    def event_generator():
+    async def event_generator():
+        last_version = -1
         last_msg = ""
         last_progress = -1.0
         while True:
+            if not await job.wait_for_update(last_version, settings.SSE_KEEPALIVE_SECONDS):
+                # Quiet stage (e.g. a long LLM call): drop orphaned streams and
+                # keep live ones from tripping proxy idle timeouts.
+                if await request.is_disconnected():
+                    break
+                yield b": keepalive\n\n"
+                continue
+            last_version = job.version
             if job.message != last_msg or job.progress != last_progress:
                 last_msg = job.message
                 last_progress = job.progress
-                data = json.dumps({
+                yield _sse_frame({
                     "status": job.status,
                     "progress": job.progress,
                     "message": job.message,
                     "error": job.error,
                 })
-                yield f"data: {data}\n\n"
-
-            if job.status in ("done", "error"):
-                # Final payload with full results
-                final = {"status": job.status, "progress": job.progress, "message": job.message}
-                if job.result:
-                    paper = job.result["paper"]
-                    final["title"] = paper.title
-                    final["authors"] = paper.authors
-                    final["abstract"] = paper.abstract
-                    tp = job.result["transcript_path"]
-                    if Path(tp).exists():
-                        final["transcript"] = Path(tp).read_text(encoding="utf-8")
-                    ap = job.result.get("audio_path")
-                    if ap and Path(ap).exists():
-                        final["audio_url"] = f"/api/audio/{Path(ap).name}"
-                if job.error:
-                    final["error"] = job.error
-                yield f"data: {json.dumps(final)}\n\n"
+
+            if job.final_frame is not None:
+                # Final payload with full results, pre-encoded by the worker
+                yield job.final_frame
                 break
-            time.sleep(0.3)
 
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        # Stop proxies (nginx in particular) from buffering the stream
+        headers={"cache-control": "no-cache", "x-accel-buffering": "no"},
+    )
 
 
-@app.get("/api/audio/{filename}")
-def serve_audio(filename: str):
-    """Serve a generated audio file."""
-    path = config.OUTPUT_DIR / filename
-    if not path.exists():
+@app.get("/api/transcript/{job_id}")
+async def get_transcript(job_id: str):
+    """Serve a finished job's transcript as plain text."""
+    job = _jobs.get(job_id)
+    if not job:
+        raise HTTPException(404, "Job not found")
+    if job.transcript_path is None:
+        raise HTTPException(404, "Transcript not available")
+    return ZeroCopyFileResponse(job.transcript_path, media_type="text/plain; charset=utf-8")
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the file validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*"
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+@app.get("/api/audio/{job_id}/{filename}")
+def serve_audio(job_id: str, filename: str, request: Request):
+    """Serve a generated audio file from its job's output directory."""
+    if not job_id.isalnum() or filename in (".", ".."):
+        raise HTTPException(404, "Audio file not found")
+    path = settings.OUTPUT_DIR / job_id / filename
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         raise HTTPException(404, "Audio file not found")
     media = "audio/wav" if filename.endswith(".wav") else "audio/mpeg"
-    return FileResponse(path, media_type=media, filename=filename)
+
+    # Each job writes its own file and never rewrites it, so browsers can
+    # keep it without revalidating on every seek; the validators remain
+    # for clients that ask anyway.
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    validators = {
+        "etag": etag,
+        "last-modified": formatdate(st.st_mtime, usegmt=True),
+        "cache-control": "public, max-age=31536000, immutable",
+    }
+    if _not_modified(request, etag, st.st_mtime):
+        return Response(status_code=304, headers=validators)
+
+    # A Range is only valid against the representation the client already
+    # holds; a stale If-Range gets the whole file (RFC 9110 §13.1.5).
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and if_range and if_range not in (etag, validators["last-modified"]):
+        range_header = None
+
+    if settings.USE_X_ACCEL:
+        # Let nginx stream the file from an `internal` location
+        return Response(
+            headers={
+                **validators,
+                "x-accel-redirect": f"{settings.X_ACCEL_PREFIX}{job_id}/{filename}",
+                "content-type": media,
+                "content-disposition": f'attachment; filename="{filename}"',
+            },
+        )
+
+    return ZeroCopyFileResponse(
+        path,
+        media_type=media,
+        filename=filename,
+        range_header=range_header,
+        headers=validators,
+        stat_result=st,
+    )
 
 
 if __name__ == "__main__":
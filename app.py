@@ -1,6 +1,10 @@
 """
 app.py — Streamlit interface for the ArXiv-to-Podcast pipeline.
 
+The pipeline itself runs in the FastAPI backend (``api.py``); this UI
+submits a job over REST and follows its progress over SSE, so the
+Streamlit session is never blocked on LLM / TTS work.
+
 Single-page app with:
   • Text input for arXiv URL / paper ID
   • Sidebar for LLM backend and TTS engine selection
@@ -11,16 +15,44 @@ Single-page app with:
 
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
+from typing import Iterator
 
 # Ensure project root is on the path so imports work
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import requests
 import streamlit as st
 
-import config
-from src.pipeline import run_pipeline
+from config import settings
+
+
+def _iter_sse(resp: requests.Response) -> Iterator[dict]:
+    """Yield the JSON payload of every ``data:`` frame in an SSE response."""
+    for line in resp.iter_lines(decode_unicode=True):
+        if line and line.startswith("data:"):
+            yield json.loads(line[5:])
+
+
+# Streamlit re-executes this script on every widget interaction; the
+# artefacts of a finished job never change, so fetch them once per job and
+# serve reruns from memory.  Both URLs contain the job ID, so they key the
+# cache on their own.
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def load_transcript(url: str) -> str:
+    resp = requests.get(f"{settings.API_BASE_URL}{url}", timeout=30)
+    resp.raise_for_status()
+    return resp.text
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_audio_bytes(url: str) -> bytes:
+    resp = requests.get(f"{settings.API_BASE_URL}{url}", timeout=60)
+    resp.raise_for_status()
+    return resp.content
 
 
 # ─────────────────────────────────────────────
@@ -131,26 +163,54 @@ if generate_btn:
     progress_bar = st.progress(0)
     status_text = st.empty()
 
-    def _progress(msg: str, frac: float) -> None:
-        progress_bar.progress(min(frac, 1.0))
-        status_text.text(msg)
-
     try:
-        result = run_pipeline(
-            arxiv_url=arxiv_input.strip(),
-            llm_backend=llm_backend,
-            tts_engine=tts_engine,
-            generate_audio_flag=generate_audio_flag,
-            progress_callback=_progress,
+        resp = requests.post(
+            f"{settings.API_BASE_URL}/api/generate",
+            json={
+                "arxiv_url": arxiv_input.strip(),
+                "llm_backend": llm_backend,
+                "tts_engine": tts_engine,
+                "generate_audio": generate_audio_flag,
+            },
+            timeout=30,
+        )
+        resp.raise_for_status()
+        job_id = resp.json()["job_id"]
+
+        result: dict = {}
+        with requests.get(
+            f"{settings.API_BASE_URL}/api/stream/{job_id}", stream=True, timeout=None,
+        ) as stream:
+            stream.raise_for_status()
+            for event in _iter_sse(stream):
+                progress_bar.progress(min(event.get("progress", 0.0), 1.0))
+                status_text.text(event.get("message", ""))
+                if event.get("status") in ("done", "error"):
+                    result = event
+                    break
+    except requests.RequestException as exc:
+        st.error(
+            f"Could not reach the PaperCast API at {settings.API_BASE_URL}: {exc}. "
+            "Start it with `python api.py`."
         )
-    except Exception as exc:
-        st.error(f"Pipeline failed: {exc}")
-        st.exception(exc)
+        st.stop()
+
+    if result.get("status") != "done":
+        st.error(f"Pipeline failed: {result.get('error') or result.get('message', 'unknown error')}")
         st.stop()
 
     progress_bar.progress(1.0)
     status_text.text("Done!")
 
+    result["job_id"] = job_id
+    st.session_state["result"] = result
+
+# ─────────────────────────────────────────────
+# Results (kept across reruns)
+# ─────────────────────────────────────────────
+
+result = st.session_state.get("result")
+if result:
     st.success("Podcast generated successfully!")
 
     # ── Split view: transcript + audio ───────────────────
@@ -158,7 +218,9 @@ if generate_btn:
 
     with col_left:
         st.subheader("Transcript")
-        transcript_text = result["transcript_path"].read_text(encoding="utf-8")
+        transcript_text = ""
+        if result.get("transcript_url"):
+            transcript_text = load_transcript(result["transcript_url"])
         st.markdown(
             f'<div class="transcript-box">{transcript_text}</div>',
             unsafe_allow_html=True,
@@ -172,14 +234,16 @@ if generate_btn:
 
     with col_right:
         st.subheader("Audio")
-        audio_path = result.get("audio_path")
-        if audio_path and audio_path.exists():
-            audio_bytes = audio_path.read_bytes()
-            st.audio(audio_bytes, format="audio/mp3")
+        audio_url = result.get("audio_url")
+        if audio_url:
+            # Fetched here rather than handing the browser the API URL,
+            # which need not be reachable from outside this server
+            audio_bytes = load_audio_bytes(audio_url)
+            st.audio(audio_bytes, format=f"audio/{settings.AUDIO_FORMAT}")
             st.download_button(
                 label="Download Audio",
                 data=audio_bytes,
-                file_name=f"podcast.{config.AUDIO_FORMAT}",
+                file_name=f"podcast.{settings.AUDIO_FORMAT}",
                 mime="audio/mpeg",
             )
         else:
@@ -187,7 +251,6 @@ if generate_btn:
 
     # ── Paper metadata ───────────────────────────────────
     with st.expander("Paper details"):
-        paper = result["paper"]
-        st.markdown(f"**Title:** {paper.title}")
-        st.markdown(f"**Authors:** {paper.authors}")
-        st.markdown(f"**Summary:** {result['script'].summary}")
+        st.markdown(f"**Title:** {result.get('title', '')}")
+        st.markdown(f"**Authors:** {result.get('authors', '')}")
+        st.markdown(f"**Summary:** {result.get('summary', '')}")
@@ -3,71 +3,154 @@ Central configuration for the ArXiv-to-Podcast pipeline.
 
 All tuneable knobs live here so that swapping backends or tweaking
 behaviour requires editing exactly one file.
+
+Values are frozen into a single ``Settings`` instance the first time
+``get_settings()`` runs, so ``.env`` and the environment are parsed once
+per process.  Import ``settings`` and read attributes off it.
 """
 
+from __future__ import annotations
+
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 
-# Load .env from the project root (before any os.getenv calls)
-load_dotenv(Path(__file__).resolve().parent / ".env")
-
-# ──────────────────────────────────────────────
-# Paths
-# ──────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parent
-OUTPUT_DIR = PROJECT_ROOT / "output"
-OUTPUT_DIR.mkdir(exist_ok=True)
-
-# ──────────────────────────────────────────────
-# LLM Backend  ("groq" | "openai" | "anthropic" | "ollama")
-# ──────────────────────────────────────────────
-LLM_BACKEND = os.getenv("LLM_BACKEND", "groq")
-
-# Groq (fast inference, free tier available)
-GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
-GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-
-# OpenAI
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
-# Anthropic
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
-ANTHROPIC_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
-
-# Ollama (fully offline, free)
-OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral")
-
-# Common LLM parameters
-LLM_TEMPERATURE = 0.7
-LLM_MAX_TOKENS = 4096
-
-# ──────────────────────────────────────────────
-# TTS Engine  ("groq" | "edge" | "coqui")
-# ──────────────────────────────────────────────
-TTS_ENGINE = os.getenv("TTS_ENGINE", "groq")
-
-# Groq TTS (Orpheus model via Groq API — uses GROQ_API_KEY above)
-GROQ_TTS_MODEL = "canopylabs/orpheus-v1-english"
-GROQ_VOICE_HOST = "diana"               # warm, clear female voice
-GROQ_VOICE_EXPERT = "austin"              # deep, confident male voice
-
-# edge-tts voice assignments
-EDGE_VOICE_HOST = "en-US-JennyNeural"
-EDGE_VOICE_EXPERT = "en-US-GuyNeural"
-
-# Coqui TTS model (VITS, runs on CPU)
-COQUI_MODEL_NAME = "tts_models/en/ljspeech/vits"
-
-# Audio settings
-SILENCE_BETWEEN_TURNS_MS = 600  # milliseconds of silence between speakers
-AUDIO_FORMAT = "wav"             # wav works without ffmpeg; change to mp3 if ffmpeg is installed
-
-# ──────────────────────────────────────────────
-# Pipeline
-# ──────────────────────────────────────────────
-MAX_SECTION_CHARS = 6000  # truncate very long sections before sending to LLM
-MIN_DIALOGUE_TURNS = 4    # minimum host/expert exchanges per section
+
+
+def _env(name: str, default: str, cast: Any = str) -> Any:
+    """Dataclass field whose value is read from the environment at construction."""
+    return field(default_factory=lambda: cast(os.getenv(name, default)))
+
+
+def _env_flag(value: str) -> bool:
+    return value.lower() == "true"
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    # ──────────────────────────────────────────────
+    # Paths
+    # ──────────────────────────────────────────────
+    PROJECT_ROOT: Path = PROJECT_ROOT
+    OUTPUT_DIR: Path = PROJECT_ROOT / "output"
+
+    # ──────────────────────────────────────────────
+    # LLM Backend  ("groq" | "openai" | "anthropic" | "ollama")
+    # ──────────────────────────────────────────────
+    LLM_BACKEND: str = _env("LLM_BACKEND", "groq")
+
+    # Groq (fast inference, free tier available)
+    GROQ_API_KEY: str = _env("GROQ_API_KEY", "")
+    GROQ_MODEL: str = _env("GROQ_MODEL", "llama-3.3-70b-versatile")
+
+    # OpenAI
+    OPENAI_API_KEY: str = _env("OPENAI_API_KEY", "")
+    OPENAI_MODEL: str = _env("OPENAI_MODEL", "gpt-4o-mini")
+
+    # Anthropic
+    ANTHROPIC_API_KEY: str = _env("ANTHROPIC_API_KEY", "")
+    ANTHROPIC_MODEL: str = _env("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
+
+    # Ollama (fully offline, free)
+    OLLAMA_BASE_URL: str = _env("OLLAMA_BASE_URL", "http://localhost:11434")
+    OLLAMA_MODEL: str = _env("OLLAMA_MODEL", "mistral")
+    OLLAMA_KEEP_ALIVE: str = _env("OLLAMA_KEEP_ALIVE", "10m")  # how long weights stay loaded
+
+    # Common LLM parameters
+    LLM_TEMPERATURE: float = 0.7
+    LLM_MAX_TOKENS: int = 4096
+    LLM_MAX_CONCURRENCY: int = _env("LLM_MAX_CONCURRENCY", "4", int)  # parallel requests in flight
+    LLM_RPM: int = _env("LLM_RPM", "0", int)  # max request starts per minute (0 = unlimited)
+    LLM_MAX_RETRIES: int = 4          # retries on 429 / 5xx / network errors
+    LLM_RETRY_BASE_DELAY: float = 2.0  # seconds, doubled on each retry
+
+    # Replay identical requests (same backend, model, params and messages)
+    # from disk instead of calling the provider again.  Off by default since
+    # sampling at LLM_TEMPERATURE > 0 is otherwise non-deterministic.
+    LLM_CACHE_ENABLED: bool = _env("LLM_CACHE_ENABLED", "", _env_flag)
+    LLM_CACHE_DIR: Path = _env("LLM_CACHE_DIR", str(PROJECT_ROOT / ".cache" / "llm"), Path)
+
+    # ──────────────────────────────────────────────
+    # TTS Engine  ("groq" | "edge" | "coqui")
+    # ──────────────────────────────────────────────
+    TTS_ENGINE: str = _env("TTS_ENGINE", "groq")
+
+    # Groq TTS (Orpheus model via Groq API — uses GROQ_API_KEY above)
+    GROQ_TTS_MODEL: str = "canopylabs/orpheus-v1-english"
+    GROQ_VOICE_HOST: str = "diana"               # warm, clear female voice
+    GROQ_VOICE_EXPERT: str = "austin"              # deep, confident male voice
+    GROQ_TTS_CONCURRENCY: int = _env("GROQ_TTS_CONCURRENCY", "4", int)  # turns synthesized in parallel
+
+    # edge-tts voice assignments
+    EDGE_VOICE_HOST: str = "en-US-JennyNeural"
+    EDGE_VOICE_EXPERT: str = "en-US-GuyNeural"
+    EDGE_TTS_CONCURRENCY: int = _env("EDGE_TTS_CONCURRENCY", "4", int)  # turns synthesized in parallel
+
+    # Coqui TTS model (VITS, runs on CPU)
+    COQUI_MODEL_NAME: str = "tts_models/en/ljspeech/vits"
+    # Turns synthesized in parallel on the shared model.  PyTorch already
+    # spreads one utterance over the CPU cores, so raise this only where
+    # that leaves cores idle.
+    COQUI_TTS_WORKERS: int = _env("COQUI_TTS_WORKERS", "1", int)
+
+    # Replay clips for turns already spoken with the same engine and voice
+    # from disk instead of synthesizing them again.  Least recently used
+    # clips are evicted once the directory grows past TTS_CACHE_MAX_MB.
+    TTS_CACHE_ENABLED: bool = _env("TTS_CACHE_ENABLED", "", _env_flag)
+    TTS_CACHE_DIR: Path = _env("TTS_CACHE_DIR", str(PROJECT_ROOT / ".cache" / "tts"), Path)
+    TTS_CACHE_MAX_MB: int = _env("TTS_CACHE_MAX_MB", "500", int)
+
+    # Audio settings
+    SILENCE_BETWEEN_TURNS_MS: int = 600  # milliseconds of silence between speakers
+    AUDIO_FORMAT: str = "wav"             # wav works without ffmpeg; change to mp3 if ffmpeg is installed
+
+    # ──────────────────────────────────────────────
+    # Pipeline
+    # ──────────────────────────────────────────────
+    MAX_SECTION_CHARS: int = 6000  # truncate very long sections before sending to LLM
+    MIN_DIALOGUE_TURNS: int = 4    # minimum host/expert exchanges per section
+
+    # PDF text extraction fans out across processes for long papers; each
+    # worker handles at least PDF_PAGES_PER_WORKER pages so process start-up
+    # stays small next to the extraction itself.  0 workers = one per CPU.
+    PDF_EXTRACT_WORKERS: int = _env("PDF_EXTRACT_WORKERS", "0", int)
+    PDF_PAGES_PER_WORKER: int = 16
+
+    # Downloaded arXiv PDFs are kept here keyed by paper ID and reused on
+    # the next run of the same paper.  Only versioned IDs (…v2) are cached;
+    # least recently used PDFs are evicted past PDF_CACHE_MAX_MB.
+    PDF_CACHE_ENABLED: bool = _env("PDF_CACHE_ENABLED", "true", _env_flag)
+    PDF_CACHE_DIR: Path = _env("PDF_CACHE_DIR", str(PROJECT_ROOT / ".cache" / "pdf"), Path)
+    PDF_CACHE_MAX_MB: int = _env("PDF_CACHE_MAX_MB", "500", int)
+
+    # ──────────────────────────────────────────────
+    # API server
+    # ──────────────────────────────────────────────
+    JOB_STORE_MAX_SIZE: int = 512   # jobs kept in memory before LRU eviction
+    JOB_TTL_SECONDS: int = 3600     # finished jobs are dropped after this long
+    PIPELINE_WORKERS: int = _env("PAPERCAST_WORKERS", "2", int)  # concurrent pipeline runs
+    MAX_QUEUED_JOBS: int = 16       # pending + running jobs before /api/generate returns 503
+    SSE_KEEPALIVE_SECONDS: float = 20.0  # idle gap before /api/stream sends a comment ping
+
+    # Behind nginx, hand audio downloads off via X-Accel-Redirect so the
+    # proxy's sendfile serves the bytes instead of a uvicorn worker.
+    USE_X_ACCEL: bool = _env("USE_X_ACCEL", "", _env_flag)
+    X_ACCEL_PREFIX: str = _env("X_ACCEL_PREFIX", "/internal-audio/")
+
+    # Where the Streamlit UI (app.py) reaches the API server
+    API_BASE_URL: str = _env("PAPERCAST_API_URL", "http://localhost:8000")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load ``.env`` from the project root and freeze the settings (once)."""
+    load_dotenv(PROJECT_ROOT / ".env")
+    return Settings()
+
+
+settings = get_settings()
@@ -5,7 +5,7 @@ import InputPanel from "./components/InputPanel";
 import ProgressPanel from "./components/ProgressPanel";
 import ResultsPanel from "./components/ResultsPanel";
 import Footer from "./components/Footer";
-import { startGeneration, streamJobProgress, fetchJobStatus } from "./api";
+import { startGeneration, streamJobProgress, fetchJobStatus, fetchTranscript } from "./api";
 
 // App states: idle → loading → done | error
 function App() {
@@ -39,11 +39,15 @@ function App() {
       }
 
       // If the SSE final payload has results, use them;
-      // otherwise poll once more.
+      // otherwise poll once more. Large transcripts arrive by URL.
       let resultData = final;
-      if (!final.transcript) {
+      if (!final.transcript && !final.transcript_url) {
         resultData = await fetchJobStatus(job_id);
       }
+      if (!resultData.transcript && resultData.transcript_url) {
+        const transcript = await fetchTranscript(resultData.transcript_url);
+        resultData = { ...resultData, transcript };
+      }
 
       setResult(resultData);
       setPhase("done");
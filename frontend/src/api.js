@@ -48,6 +48,12 @@ export async function fetchJobStatus(jobId) {
   return res.json();
 }
 
+export async function fetchTranscript(path) {
+  const res = await fetch(`${API_BASE}${path}`);
+  if (!res.ok) throw new Error(`Transcript fetch failed: ${res.status}`);
+  return res.text();
+}
+
 export function getAudioUrl(path) {
   return `${API_BASE}${path}`;
 }
@@ -3,6 +3,8 @@ templates.py — System prompts, persona definitions, and few-shot examples
 for the multi-stage dialogue generation pipeline.
 """
 
+import sys
+
 # ─────────────────────────────────────────────
 # Persona definitions
 # ─────────────────────────────────────────────
@@ -39,6 +41,12 @@ SUMMARY_SYSTEM_PROMPT = (
     "Avoid jargon. Do not use LaTeX or citations."
 )
 
+TAKEAWAY_SYSTEM_PROMPT = (
+    "You are a science podcast expert. In exactly one sentence, give "
+    "the single most important takeaway from this paper. Be vivid and "
+    "memorable. Speak directly to the listener."
+)
+
 
 # ─────────────────────────────────────────────
 # System prompt for dialogue generation
@@ -144,6 +152,42 @@ FEW_SHOT_EXAMPLES = [
 ]
 
 
+# Prompt constants are sent on every LLM call; intern them and build their
+# message dicts once so the builders below only allocate the user turn.
+HOST_PERSONA = sys.intern(HOST_PERSONA)
+EXPERT_PERSONA = sys.intern(EXPERT_PERSONA)
+SUMMARY_SYSTEM_PROMPT = sys.intern(SUMMARY_SYSTEM_PROMPT)
+DIALOGUE_SYSTEM_PROMPT = sys.intern(DIALOGUE_SYSTEM_PROMPT)
+TAKEAWAY_SYSTEM_PROMPT = sys.intern(TAKEAWAY_SYSTEM_PROMPT)
+
+_SUMMARY_SYSTEM_MSG = {"role": "system", "content": SUMMARY_SYSTEM_PROMPT}
+_TAKEAWAY_SYSTEM_MSG = {"role": "system", "content": TAKEAWAY_SYSTEM_PROMPT}
+
+# The few-shot block never changes, so render it (and the messages that
+# carry it) once at import instead of on every section.
+FEW_SHOT_BLOCK = "".join(
+    f"--- EXAMPLE ---\n"
+    f"Section: {ex['section_title']}\n"
+    f"Text: {ex['section_text']}\n\n"
+    f"Dialogue:\n{ex['dialogue']}\n"
+    f"--- END EXAMPLE ---\n\n"
+    for ex in FEW_SHOT_EXAMPLES
+)
+
+_DIALOGUE_SYSTEM_MSG = {"role": "system", "content": DIALOGUE_SYSTEM_PROMPT}
+_FEW_SHOT_USER_MSG = {
+    "role": "user",
+    "content": f"Here are examples of the style I want:\n\n{FEW_SHOT_BLOCK}",
+}
+_FEW_SHOT_ACK_MSG = {
+    "role": "assistant",
+    "content": (
+        "Understood. I'll follow that conversational style, with clear HOST/EXPERT "
+        "labels, analogies, and an engaging tone. Please provide the section to convert."
+    ),
+}
+
+
 # ─────────────────────────────────────────────
 # Intro / Outro templates
 # ─────────────────────────────────────────────
@@ -175,7 +219,7 @@ OUTRO_TEMPLATE = (
 def build_summary_messages(paper_text: str) -> list[dict[str, str]]:
     """Build the message list for paper-summary generation."""
     return [
-        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+        _SUMMARY_SYSTEM_MSG,
         {"role": "user", "content": f"Paper text:\n\n{paper_text}"},
     ]
 
@@ -189,17 +233,10 @@ def build_dialogue_messages(
     Build the message list for a single section's dialogue generation.
     Includes few-shot examples for tone and format guidance.
     """
-    # Construct few-shot block
-    few_shot_block = ""
-    for ex in FEW_SHOT_EXAMPLES:
-        few_shot_block += (
-            f"--- EXAMPLE ---\n"
-            f"Section: {ex['section_title']}\n"
-            f"Text: {ex['section_text']}\n\n"
-            f"Dialogue:\n{ex['dialogue']}\n"
-            f"--- END EXAMPLE ---\n\n"
-        )
-
+    # Everything up to the section title is identical across a paper's
+    # section calls (shared system + few-shot messages, then the summary),
+    # so provider prompt caches can reuse the prefill.  Keep per-section
+    # values out of that prefix.
     user_prompt = (
         f"Paper summary (for context): {paper_summary}\n\n"
         f"Now generate a podcast dialogue for the following section.\n\n"
@@ -210,9 +247,9 @@ def build_dialogue_messages(
     )
 
     return [
-        {"role": "system", "content": DIALOGUE_SYSTEM_PROMPT},
-        {"role": "user", "content": f"Here are examples of the style I want:\n\n{few_shot_block}"},
-        {"role": "assistant", "content": "Understood. I'll follow that conversational style, with clear HOST/EXPERT labels, analogies, and an engaging tone. Please provide the section to convert."},
+        _DIALOGUE_SYSTEM_MSG,
+        _FEW_SHOT_USER_MSG,
+        _FEW_SHOT_ACK_MSG,
         {"role": "user", "content": user_prompt},
     ]
 
@@ -220,13 +257,6 @@ def build_dialogue_messages(
 def build_takeaway_messages(paper_summary: str) -> list[dict[str, str]]:
     """Build messages for generating a one-sentence takeaway for the outro."""
     return [
-        {
-            "role": "system",
-            "content": (
-                "You are a science podcast expert. In exactly one sentence, give "
-                "the single most important takeaway from this paper. Be vivid and "
-                "memorable. Speak directly to the listener."
-            ),
-        },
+        _TAKEAWAY_SYSTEM_MSG,
         {"role": "user", "content": f"Paper summary: {paper_summary}"},
     ]
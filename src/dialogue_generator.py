@@ -9,15 +9,18 @@ full podcast script by:
 
 Each stage is a separate LLM call, keeping prompts focused and
 improving output quality compared to a single monolithic prompt.
+Once the summary is back, the section dialogues and the takeaway only
+depend on it, so they are issued concurrently.
 """
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Callable, Optional
 
-import config
+from config import settings
 from prompts.templates import (
     INTRO_TEMPLATE,
     OUTRO_TEMPLATE,
@@ -25,7 +28,7 @@ from prompts.templates import (
     build_summary_messages,
     build_takeaway_messages,
 )
-from src.llm_interface import query_llm
+from src.llm_interface import query_llm_batch, query_llm_stream
 
 logger = logging.getLogger(__name__)
 
@@ -47,13 +50,16 @@ class FullScript:
     intro: str = ""
     outro: str = ""
 
-    @property
+    @cached_property
     def full_text(self) -> str:
-        """Concatenate intro + segments + outro into a single script."""
+        """
+        Concatenate intro + segments + outro into a single script.
+
+        Computed on first access; the script is not edited once assembled.
+        """
         parts = [self.intro]
         for seg in self.segments:
-            parts.append(f"\n\n--- {seg.section_title.upper()} ---\n\n")
-            parts.append(seg.raw_dialogue)
+            parts += ("\n\n--- " + seg.section_title.upper() + " ---\n\n", seg.raw_dialogue)
         parts.append(self.outro)
         return "\n".join(parts)
 
@@ -117,40 +123,68 @@ def generate_script(
         summary_input = paper_sections.get("abstract", "No abstract available.")
 
     # Truncate if very long
-    summary_input = summary_input[: config.MAX_SECTION_CHARS * 2]
+    summary_input = summary_input[: settings.MAX_SECTION_CHARS * 2]
 
+    # Everything downstream waits on the summary, so stream it and keep the
+    # progress line moving instead of sitting silent for the whole call.
     summary_messages = build_summary_messages(summary_input)
-    summary = query_llm(summary_messages, backend=backend)
+    parts: list[str] = []
+    received = next_report = 0
+    for delta in query_llm_stream(summary_messages, backend=backend):
+        parts.append(delta)
+        received += len(delta)
+        if received >= next_report:
+            _progress(f"Generating paper summary… ({received} chars)", 0.10)
+            next_report = received + 400
+    summary = "".join(parts).strip()
 
     _progress("Summary generated.", 0.15)
 
-    # ── Stage 2: Generate per-section dialogue ───────────────
-    segments: list[DialogueSegment] = []
-    non_empty_sections = [
-        (display, key)
-        for display, key in _DIALOGUE_SECTIONS
-        if paper_sections.get(key, "").strip()
-    ]
+    # ── Stages 2 + 3: Per-section dialogue and takeaway ──────
+    # Every remaining call depends only on the summary, so fan them out
+    # and wait for the slowest rather than the sum of all of them.
+    # Malformed PDFs sometimes yield the same text under two headings
+    # (e.g. the abstract bleeding into the introduction); discuss it once
+    # rather than paying for, and airing, the same dialogue twice.
+    non_empty_sections: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for display, key in _DIALOGUE_SECTIONS:
+        text = paper_sections.get(key, "")
+        if not text.strip():
+            continue
+        text = text[: settings.MAX_SECTION_CHARS]
+        if text.strip() in seen:
+            logger.info("Skipping %s: same text as an earlier section.", display)
+            continue
+        seen.add(text.strip())
+        non_empty_sections.append((display, text))
     total = len(non_empty_sections)
+    _progress(f"Generating dialogue for {total} sections…", 0.15)
 
-    for idx, (display_name, key) in enumerate(non_empty_sections):
-        frac = 0.15 + 0.70 * (idx / max(total, 1))
-        _progress(f"Generating dialogue for {display_name}…", frac)
+    # The takeaway rides along as the last prompt of the batch
+    prompts = [
+        build_dialogue_messages(display_name, text, summary)
+        for display_name, text in non_empty_sections
+    ]
+    prompts.append(build_takeaway_messages(summary))
 
-        section_text = paper_sections[key][: config.MAX_SECTION_CHARS]
-        messages = build_dialogue_messages(display_name, section_text, summary)
-        dialogue_text = query_llm(messages, backend=backend)
+    finished = 0
 
-        segments.append(
-            DialogueSegment(section_title=display_name, raw_dialogue=dialogue_text)
-        )
+    def _on_result(idx: int, _reply: str) -> None:
+        nonlocal finished
+        if idx == total:
+            return
+        finished += 1
+        frac = 0.15 + 0.70 * (finished / max(total, 1))
+        _progress(f"Dialogue for {non_empty_sections[idx][0]} done.", frac)
 
-    _progress("All section dialogues generated.", 0.85)
+    *dialogues, takeaway = query_llm_batch(prompts, backend=backend, on_result=_on_result)
+    _progress("Closing takeaway generated.", 0.90)
 
-    # ── Stage 3: Generate outro takeaway ─────────────────────
-    _progress("Generating closing takeaway…", 0.90)
-    takeaway_messages = build_takeaway_messages(summary)
-    takeaway = query_llm(takeaway_messages, backend=backend)
+    segments = [
+        DialogueSegment(section_title=display_name, raw_dialogue=dialogue_text)
+        for (display_name, _), dialogue_text in zip(non_empty_sections, dialogues)
+    ]
 
     # ── Stage 4: Assemble full script ────────────────────────
     _progress("Assembling final script…", 0.95)
@@ -158,7 +192,7 @@ def generate_script(
     # Truncate author list for a friendlier intro
     authors_short = authors
     if len(authors) > 120:
-        first_author = authors.split(",")[0].strip()
+        first_author = authors.partition(",")[0].strip()
         authors_short = f"{first_author} and colleagues"
 
     intro = INTRO_TEMPLATE.format(
@@ -3,9 +3,10 @@ latex_to_speech.py — Convert LaTeX math into natural spoken English.
 
 Uses a combination of:
   1. A lookup table for Greek letters and common operators.
-  2. Regex-based pattern matching for structural constructs (fractions,
-     superscripts, subscripts, sums, integrals, etc.).
-  3. Recursive descent for nested expressions.
+  2. A single compiled tokeniser regex whose matches dispatch through
+     command / symbol tables to handlers for structural constructs
+     (fractions, superscripts, subscripts, sums, integrals, etc.).
+  3. An explicit stack of suspended frames for nested expressions.
 
 This module runs *before* dialogue generation so the LLM receives clean,
 speakable text with no raw LaTeX.
@@ -14,7 +15,8 @@ speakable text with no raw LaTeX.
 from __future__ import annotations
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 
 # ─────────────────────────────────────────────
@@ -80,22 +82,30 @@ def _extract_braced(text: str, start: int) -> tuple[str, int]:
             return text[start], start + 1
         return "", start
 
-    depth = 0
-    i = start
-    while i < len(text):
-        if text[i] == "{":
-            depth += 1
-        elif text[i] == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start + 1 : i], i + 1
-        i += 1
+    # Hop from one '}' to the next, counting the '{' in between; both
+    # scans run in C instead of a Python loop over every character.
+    depth = 1
+    pos = start + 1
+    while (close := text.find("}", pos)) != -1:
+        depth += text.count("{", pos, close) - 1
+        if depth == 0:
+            return text[start + 1 : close], close + 1
+        pos = close + 1
     # Unmatched – return everything after opening brace
     return text[start + 1 :], len(text)
 
 
+# Optional spaces, then a flat ``{...}`` group or any single character
+_ARG_RE = re.compile(r" *(?:\{([^{}]*)\}|([^{ ]))", re.DOTALL)
+
+
 def _next_arg(text: str, pos: int) -> tuple[str, int]:
     """Skip optional whitespace, then extract the next braced group or single char."""
+    m = _ARG_RE.match(text, pos)
+    if m is not None:
+        flat, char = m.groups()
+        return (char if flat is None else flat), m.end()
+    # Nested group, unterminated brace or end of input
     while pos < len(text) and text[pos] == " ":
         pos += 1
     if pos >= len(text):
@@ -104,181 +114,216 @@ def _next_arg(text: str, pos: int) -> tuple[str, int]:
 
 
 # ─────────────────────────────────────────────
-# Core recursive converter
+# Command / symbol handlers
 # ─────────────────────────────────────────────
+#
+# Each handler receives the source string and the index just past the
+# token it was dispatched on, consumes any arguments it needs, and
+# returns ``(emit, args, new_index)``.  The converter turns every raw
+# LaTeX string in ``args`` into speech and appends ``emit(*spoken_args)``;
+# ``emit`` of None emits nothing.
 
-def _convert_token_stream(latex: str) -> str:
-    """
-    Walk through *latex* character by character, recognising commands
-    and converting them into spoken English fragments.
-    """
-    result: list[str] = []
-    i = 0
-    n = len(latex)
-
-    while i < n:
-        ch = latex[i]
-
-        # ── LaTeX command (\something) ─────────────────────────
-        if ch == "\\":
-            # Collect command name
-            j = i + 1
-            while j < n and latex[j].isalpha():
-                j += 1
-            cmd = latex[i + 1 : j]
-            i = j  # advance past command name
-
-            # Greek letter
-            if cmd in GREEK_LETTERS:
-                result.append(GREEK_LETTERS[cmd])
-                continue
+Emit = Callable[..., str]
+Handler = Callable[[str, int], tuple[Optional[Emit], tuple[str, ...], int]]
 
-            # Operator / symbol
-            if cmd in OPERATORS:
-                result.append(OPERATORS[cmd])
-                continue
+_as_is: Emit = "{}".format
 
-            # Accent / decoration
-            if cmd in ACCENTS:
-                arg, i = _next_arg(latex, i)
-                inner = _convert_token_stream(arg)
-                result.append(f"{inner} {ACCENTS[cmd]}")
-                continue
 
-            # Fraction  \frac{a}{b}
-            if cmd == "frac":
-                num, i = _next_arg(latex, i)
-                den, i = _next_arg(latex, i)
-                num_spoken = _convert_token_stream(num)
-                den_spoken = _convert_token_stream(den)
-                result.append(f"{num_spoken} divided by {den_spoken}")
-                continue
+def _accent(word: str) -> Handler:
+    emit = f"{{}} {word}".format
 
-            # Square root  \sqrt{x}  or  \sqrt[n]{x}
-            if cmd == "sqrt":
-                # Optional arg [n]
-                degree = ""
-                if i < n and latex[i] == "[":
-                    end_bracket = latex.index("]", i)
-                    degree = latex[i + 1 : end_bracket]
-                    i = end_bracket + 1
-                arg, i = _next_arg(latex, i)
-                inner = _convert_token_stream(arg)
-                if degree:
-                    deg_spoken = _convert_token_stream(degree)
-                    result.append(f"the {deg_spoken} root of {inner}")
-                else:
-                    result.append(f"the square root of {inner}")
-                continue
+    def handle(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+        arg, i = _next_arg(latex, i)
+        return emit, (arg,), i
+    return handle
 
-            # Sum / Product with limits
-            if cmd in ("sum", "prod"):
-                word = "sum" if cmd == "sum" else "product"
-                result.append(f"the {word}")
-                continue
 
-            # Integral
-            if cmd in ("int", "iint", "iiint", "oint"):
-                result.append("the integral")
-                continue
+def _frac(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    num, i = _next_arg(latex, i)
+    den, i = _next_arg(latex, i)
+    return "{} divided by {}".format, (num, den), i
 
-            # Text commands  \text{...}, \mathrm{...}, \textbf{...}, etc.
-            if cmd in ("text", "mathrm", "textbf", "textit", "mathbf",
-                        "mathit", "mathcal", "mathbb", "operatorname"):
-                arg, i = _next_arg(latex, i)
-                result.append(_convert_token_stream(arg))
-                continue
 
-            # \left, \right — skip sizing delimiters
-            if cmd in ("left", "right", "big", "Big", "bigg", "Bigg"):
-                # skip the following delimiter character
-                if i < n and latex[i] in r"()[]{}|.\\/":
-                    i += 1
-                continue
+def _sqrt(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    # Optional arg [n]
+    degree = ""
+    if i < len(latex) and latex[i] == "[":
+        end_bracket = latex.index("]", i)
+        degree = latex[i + 1 : end_bracket]
+        i = end_bracket + 1
+    arg, i = _next_arg(latex, i)
+    if degree:
+        return "the {} root of {}".format, (degree, arg), i
+    return "the square root of {}".format, (arg,), i
 
-            # \begin{...} / \end{...} — skip environment markers
-            if cmd in ("begin", "end"):
-                _, i = _next_arg(latex, i)
-                continue
 
-            # Unknown command — just emit name
-            result.append(cmd)
-            continue
-
-        # ── Superscript ────────────────────────────────────────
-        if ch == "^":
-            i += 1
-            arg, i = _next_arg(latex, i)
-            inner = _convert_token_stream(arg)
-            # Common cases
-            if inner == "2":
-                result.append("squared")
-            elif inner == "3":
-                result.append("cubed")
-            elif inner == "T":
-                result.append("transpose")
-            elif inner == "-1":
-                result.append("inverse")
-            else:
-                result.append(f"to the power of {inner}")
-            continue
-
-        # ── Subscript ──────────────────────────────────────────
-        if ch == "_":
-            i += 1
-            arg, i = _next_arg(latex, i)
-            inner = _convert_token_stream(arg)
-            result.append(f"sub {inner}")
-            continue
-
-        # ── Braces (grouping) ──────────────────────────────────
-        if ch == "{":
-            content, i = _extract_braced(latex, i)
-            result.append(_convert_token_stream(content))
-            continue
-
-        # ── Skip whitespace / noise characters ─────────────────
-        if ch in " \t\n":
-            i += 1
-            continue
-        if ch in "&":
-            i += 1
-            continue
-
-        # ── Infix operators ────────────────────────────────────
-        if ch == "+":
-            result.append("plus")
-            i += 1
-            continue
-        if ch == "-":
-            result.append("minus")
-            i += 1
-            continue
-        if ch == "=":
-            result.append("equals")
-            i += 1
-            continue
-        if ch == "<":
-            result.append("less than")
-            i += 1
-            continue
-        if ch == ">":
-            result.append("greater than")
-            i += 1
-            continue
-        if ch in "()[]|":
-            i += 1
-            continue
-        if ch == ",":
-            result.append(",")
-            i += 1
-            continue
-
-        # ── Literal character (letter / digit) ─────────────────
-        result.append(ch)
+def _text(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    arg, i = _next_arg(latex, i)
+    return _as_is, (arg,), i
+
+
+def _sizing(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    # skip the following delimiter character
+    if i < len(latex) and latex[i] in r"()[]{}|.\/":
         i += 1
+    return None, (), i
+
+
+def _environment(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    _, i = _next_arg(latex, i)
+    return None, (), i
+
+
+_SUPERSCRIPT_WORDS = {"2": "squared", "3": "cubed", "T": "transpose", "-1": "inverse"}
+
+
+def _power(inner: str) -> str:
+    return _SUPERSCRIPT_WORDS.get(inner) or f"to the power of {inner}"
+
+
+def _superscript(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    arg, i = _next_arg(latex, i)
+    return _power, (arg,), i
 
-    return " ".join(result)
+
+def _subscript(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    arg, i = _next_arg(latex, i)
+    return "sub {}".format, (arg,), i
+
+
+def _group(latex: str, i: int) -> tuple[Optional[Emit], tuple[str, ...], int]:
+    content, i = _extract_braced(latex, i - 1)
+    return _as_is, (content,), i
+
+
+# Every ``\command`` resolves through one dict lookup: a plain string is
+# emitted as-is, anything else is a handler.  Later tables win, giving the
+# original precedence Greek > operators > accents > structural commands.
+_CMD_TABLE: dict[str, str | Handler] = {
+    "frac": _frac,
+    "sqrt": _sqrt,
+    "sum": "the sum", "prod": "the product",
+    **dict.fromkeys(("int", "iint", "iiint", "oint"), "the integral"),
+    **dict.fromkeys(
+        ("text", "mathrm", "textbf", "textit", "mathbf",
+         "mathit", "mathcal", "mathbb", "operatorname"),
+        _text,
+    ),
+    **dict.fromkeys(("left", "right", "big", "Big", "bigg", "Bigg"), _sizing),
+    **dict.fromkeys(("begin", "end"), _environment),
+    **{cmd: _accent(word) for cmd, word in ACCENTS.items()},
+    **OPERATORS,
+    **GREEK_LETTERS,
+}
+
+_CHAR_TABLE: dict[str, str | Handler] = {
+    "^": _superscript,
+    "_": _subscript,
+    "{": _group,
+    "+": "plus",
+    "-": "minus",
+    "=": "equals",
+    "<": "less than",
+    ">": "greater than",
+    ",": ",",
+}
+
+# One token per match: a command name (possibly empty, e.g. ``\,``), a run
+# of plain characters and skippable whitespace / delimiters, or a single
+# special character.
+_TOKEN_RE = re.compile(
+    r"\\([^\W\d_]*)"
+    r"|([^\\^_{+\-=<>,]+)"
+    r"|(.)",
+    re.DOTALL,
+)
+_NON_LITERAL = frozenset("\\^_{+-=<>, \t\n&()[]|")
+_DROP_NOISE = str.maketrans("", "", " \t\n&()[]|")
+
+
+# ─────────────────────────────────────────────
+# Core converter
+# ─────────────────────────────────────────────
+
+# Spoken form of every string converted so far (whole expressions and the
+# argument strings handlers split off — ``i``, ``j=1``, ``\\theta`` recur
+# across a paper).  Cleared wholesale when full.
+_MEMO: dict[str, str] = {}
+_MEMO_MAX = 8192
+
+
+def _convert_token_stream(latex: str) -> str:
+    """
+    Tokenise *latex* with a single compiled regex and dispatch each
+    command or symbol through the lookup tables above, converting them
+    into spoken English fragments.
+
+    Nested arguments are handled with an explicit stack of suspended
+    frames rather than recursion, so arbitrarily deep input cannot hit
+    the interpreter's recursion limit.
+    """
+    memo = _MEMO
+    match = _TOKEN_RE.match
+    # Suspended frames: (text, index, result, emit, args, converted args)
+    stack: list[tuple[str, int, list[str], Emit, tuple[str, ...], list[str]]] = []
+    text, i, result = latex, 0, []
+
+    while True:
+        spoken = None
+        if i == 0:
+            # Fresh frame (resumed frames are always past their first token)
+            spoken = memo.get(text)
+            if spoken is None and len(text) == 1 and text not in _NON_LITERAL:
+                spoken = text  # bare argument such as the "2" in x^2
+
+        if spoken is None:
+            n = len(text)
+            append = result.append
+            while i < n:
+                m = match(text, i)
+                i = m.end()
+                kind = m.lastindex
+
+                if kind == 2:
+                    # Literal characters (letters / digits) — one word each;
+                    # whitespace and bare delimiters are dropped
+                    result.extend(m.group(2).translate(_DROP_NOISE))
+                    continue
+                if kind == 1:
+                    # Unknown command — just emit name
+                    cmd = m.group(1)
+                    out = _CMD_TABLE.get(cmd, cmd)
+                else:
+                    out = _CHAR_TABLE[m.group(3)]
+
+                if out.__class__ is str:
+                    append(out)
+                    continue
+                emit, args, i = out(text, i)
+                if emit is not None:
+                    break
+            else:
+                spoken = " ".join(result)
+                if len(memo) >= _MEMO_MAX:
+                    memo.clear()
+                memo[text] = spoken
+
+            if spoken is None:
+                # Suspend this frame and descend into the handler's first argument
+                stack.append((text, i, result, emit, args, []))
+                text, i, result = args[0], 0, []
+                continue
+
+        # The current frame is finished — hand its speech to the parent
+        if not stack:
+            return spoken
+        text, i, result, emit, args, converted = stack[-1]
+        converted.append(spoken)
+        if len(converted) < len(args):
+            text, i, result = args[len(converted)], 0, []
+        else:
+            stack.pop()
+            result.append(emit(*converted))
 
 
 # ─────────────────────────────────────────────
@@ -288,10 +333,14 @@ def _convert_token_stream(latex: str) -> str:
 _PLACEHOLDER_RE = re.compile(r"<<LATEX:(\d+)>>")
 
 
+@lru_cache(maxsize=4096)
 def latex_to_spoken(expr: str) -> str:
     """
     Convert a single LaTeX expression into spoken English.
 
+    Results are memoised: papers repeat the same symbols (``x``,
+    ``\\theta``, ``O(n)``) far more often than they introduce new ones.
+
     >>> latex_to_spoken(r"x^2 + y^2 = z^2")
     'x squared plus y squared equals z squared'
     >>> latex_to_spoken(r"\\frac{a}{b}")
@@ -303,15 +352,27 @@ def latex_to_spoken(expr: str) -> str:
 def replace_latex_placeholders(
     text: str,
     expressions: list[str],
+    spoken: Optional[dict[str, str]] = None,
 ) -> str:
     """
     Replace every ``<<LATEX:n>>`` placeholder in *text* with the
     spoken-English version of ``expressions[n]``.
-    """
-    def _repl(m: re.Match) -> str:
-        idx = int(m.group(1))
-        if idx < len(expressions):
-            return latex_to_spoken(expressions[idx])
-        return ""
 
-    return _PLACEHOLDER_RE.sub(_repl, text)
+    *spoken* memoises placeholder index → speech; pass the same dict for
+    every section of a paper so each expression is resolved once.
+    """
+    if "<<LATEX:" not in text:
+        return text
+    if spoken is None:
+        spoken = {}
+    n = len(expressions)
+
+    def _resolve(m: re.Match) -> str:
+        idx = m.group(1)
+        speech = spoken.get(idx)
+        if speech is None:
+            i = int(idx)
+            speech = spoken[idx] = latex_to_spoken(expressions[i]) if i < n else ""
+        return speech
+
+    return _PLACEHOLDER_RE.sub(_resolve, text)
@@ -8,13 +8,20 @@ changing one config variable — no other code changes needed.
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-from typing import Any, Optional
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional
 
-import requests
+import httpx
+import orjson
 
-import config
+from config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +33,63 @@ logger = logging.getLogger(__name__)
 Message = dict[str, str]  # {"role": "system"|"user"|"assistant", "content": "..."}
 
 
+# ─────────────────────────────────────────────
+# Shared clients
+# ─────────────────────────────────────────────
+#
+# Each SDK client owns an HTTP connection pool; building one per call
+# repeats DNS, TCP and TLS setup before every request.  Settings are
+# frozen, so one client per backend lives for the whole process.  The
+# SDKs' own retries are off: ``_call_with_retries`` is the only retry
+# layer, so attempts don't multiply.
+
+@lru_cache(maxsize=None)
+def _groq_client():
+    try:
+        from groq import Groq
+    except ImportError:
+        raise ImportError(
+            "Install the groq package:  pip install groq"
+        )
+    return Groq(api_key=settings.GROQ_API_KEY, max_retries=0)
+
+
+@lru_cache(maxsize=None)
+def _openai_client():
+    try:
+        import openai
+    except ImportError:
+        raise ImportError(
+            "Install the openai package:  pip install openai"
+        )
+    return openai.OpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
+
+
+@lru_cache(maxsize=None)
+def _anthropic_client():
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError(
+            "Install the anthropic package:  pip install anthropic"
+        )
+    return anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY, max_retries=0)
+
+
+# Pooled keep-alive connections to the local Ollama server, one per
+# concurrent section call.  (Ollama serves plain HTTP/1.1, so there is no
+# HTTP/2 multiplexing to opt into.)
+_ollama_client = httpx.Client(
+    base_url=settings.OLLAMA_BASE_URL,
+    headers={"content-type": "application/json"},
+    timeout=300,
+    limits=httpx.Limits(
+        max_connections=settings.LLM_MAX_CONCURRENCY,
+        max_keepalive_connections=settings.LLM_MAX_CONCURRENCY,
+    ),
+)
+
+
 # ─────────────────────────────────────────────
 # Backend implementations
 # ─────────────────────────────────────────────
@@ -37,15 +101,7 @@ def _query_groq(
     max_tokens: int,
 ) -> str:
     """Call Groq's ultra-fast inference API (OpenAI-compatible SDK)."""
-    try:
-        from groq import Groq
-    except ImportError:
-        raise ImportError(
-            "Install the groq package:  pip install groq"
-        )
-
-    client = Groq(api_key=config.GROQ_API_KEY)
-    response = client.chat.completions.create(
+    response = _groq_client().chat.completions.create(
         model=model,
         messages=messages,
         temperature=temperature,
@@ -61,15 +117,7 @@ def _query_openai(
     max_tokens: int,
 ) -> str:
     """Call the OpenAI-compatible chat completions endpoint."""
-    try:
-        import openai
-    except ImportError:
-        raise ImportError(
-            "Install the openai package:  pip install openai"
-        )
-
-    client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
-    response = client.chat.completions.create(
+    response = _openai_client().chat.completions.create(
         model=model,
         messages=messages,
         temperature=temperature,
@@ -78,34 +126,48 @@ def _query_openai(
     return response.choices[0].message.content.strip()
 
 
-def _query_anthropic(
-    messages: list[Message],
-    model: str,
-    temperature: float,
-    max_tokens: int,
-) -> str:
-    """Call the Anthropic Messages API."""
-    try:
-        import anthropic
-    except ImportError:
-        raise ImportError(
-            "Install the anthropic package:  pip install anthropic"
-        )
+_EPHEMERAL = {"type": "ephemeral"}
+
 
-    client = anthropic.Anthropic(api_key=config.ANTHROPIC_API_KEY)
+def _split_system(messages: list[Message]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Anthropic separates the system prompt from the message list.
 
-    # Anthropic separates system prompt from the message list
+    Anthropic only reuses a cached prompt prefix when asked to, so mark
+    the system prompt and the last message before the final user turn
+    (the end of the few-shot block every section call shares) as cache
+    breakpoints.  Prefixes shorter than the model's minimum are simply
+    not cached.
+    """
     system_text = ""
-    chat_messages: list[dict[str, str]] = []
+    chat_messages: list[dict[str, Any]] = []
     for m in messages:
         if m["role"] == "system":
             system_text += m["content"] + "\n"
         else:
             chat_messages.append({"role": m["role"], "content": m["content"]})
 
-    response = client.messages.create(
+    system_text = system_text.strip()
+    system = [{"type": "text", "text": system_text, "cache_control": _EPHEMERAL}] if system_text else []
+    if len(chat_messages) > 1:
+        shared = chat_messages[-2]
+        shared["content"] = [
+            {"type": "text", "text": shared["content"], "cache_control": _EPHEMERAL},
+        ]
+    return system, chat_messages
+
+
+def _query_anthropic(
+    messages: list[Message],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Call the Anthropic Messages API."""
+    system, chat_messages = _split_system(messages)
+    response = _anthropic_client().messages.create(
         model=model,
-        system=system_text.strip(),
+        system=system,
         messages=chat_messages,
         temperature=temperature,
         max_tokens=max_tokens,
@@ -123,28 +185,122 @@ def _query_ollama(
     Call a local Ollama instance via its REST API.
     No API key needed — runs entirely offline.
     """
-    url = f"{config.OLLAMA_BASE_URL}/api/chat"
-    payload = {
+    payload = _ollama_payload(messages, model, temperature, max_tokens, stream=False)
+    with _ollama_errors():
+        resp = _ollama_client.post("/api/chat", content=payload)
+        resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    return data["message"]["content"].strip()
+
+
+def _ollama_payload(
+    messages: list[Message],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    stream: bool,
+) -> bytes:
+    return orjson.dumps({
         "model": model,
         "messages": messages,
-        "stream": False,
+        "stream": stream,
+        "keep_alive": settings.OLLAMA_KEEP_ALIVE,
         "options": {
             "temperature": temperature,
             "num_predict": max_tokens,
         },
-    }
+    })
 
+
+@contextmanager
+def _ollama_errors() -> Iterator[None]:
     try:
-        resp = requests.post(url, json=payload, timeout=300)
-        resp.raise_for_status()
-    except requests.ConnectionError:
+        yield
+    except httpx.ConnectError:
         raise ConnectionError(
-            f"Cannot reach Ollama at {config.OLLAMA_BASE_URL}. "
+            f"Cannot reach Ollama at {settings.OLLAMA_BASE_URL}. "
             "Make sure Ollama is running (`ollama serve`)."
         )
 
-    data = resp.json()
-    return data["message"]["content"].strip()
+
+# ─────────────────────────────────────────────
+# Streaming backend implementations
+# ─────────────────────────────────────────────
+#
+# Same contract as above, but yield text deltas as they are generated.
+
+def _stream_openai_compatible(
+    client: Any,
+    messages: list[Message],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> Iterator[str]:
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+    )
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+def _stream_groq(
+    messages: list[Message],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> Iterator[str]:
+    return _stream_openai_compatible(_groq_client(), messages, model, temperature, max_tokens)
+
+
+def _stream_openai(
+    messages: list[Message],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> Iterator[str]:
+    return _stream_openai_compatible(_openai_client(), messages, model, temperature, max_tokens)
+
+
+def _stream_anthropic(
+    messages: list[Message],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> Iterator[str]:
+    system, chat_messages = _split_system(messages)
+    with _anthropic_client().messages.stream(
+        model=model,
+        system=system,
+        messages=chat_messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    ) as stream:
+        yield from stream.text_stream
+
+
+def _stream_ollama(
+    messages: list[Message],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> Iterator[str]:
+    # Ollama streams newline-delimited JSON objects
+    payload = _ollama_payload(messages, model, temperature, max_tokens, stream=True)
+    with _ollama_errors(), _ollama_client.stream("POST", "/api/chat", content=payload) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            data = orjson.loads(line)
+            if data.get("message", {}).get("content"):
+                yield data["message"]["content"]
+            if data.get("done"):
+                break
 
 
 # ─────────────────────────────────────────────
@@ -152,13 +308,156 @@ def _query_ollama(
 # ─────────────────────────────────────────────
 
 _BACKENDS = {
-    "groq": (_query_groq, lambda: config.GROQ_MODEL),
-    "openai": (_query_openai, lambda: config.OPENAI_MODEL),
-    "anthropic": (_query_anthropic, lambda: config.ANTHROPIC_MODEL),
-    "ollama": (_query_ollama, lambda: config.OLLAMA_MODEL),
+    "groq": (_query_groq, lambda: settings.GROQ_MODEL),
+    "openai": (_query_openai, lambda: settings.OPENAI_MODEL),
+    "anthropic": (_query_anthropic, lambda: settings.ANTHROPIC_MODEL),
+    "ollama": (_query_ollama, lambda: settings.OLLAMA_MODEL),
+}
+
+_STREAM_BACKENDS = {
+    "groq": _stream_groq,
+    "openai": _stream_openai,
+    "anthropic": _stream_anthropic,
+    "ollama": _stream_ollama,
 }
 
 
+# ─────────────────────────────────────────────
+# On-disk response cache
+# ─────────────────────────────────────────────
+
+def _cache_key(
+    backend: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    messages: list[Message],
+) -> str:
+    blob = orjson.dumps([backend, model, temperature, max_tokens, messages])
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    try:
+        return (settings.LLM_CACHE_DIR / f"{key}.txt").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _cache_put(key: str, reply: str) -> None:
+    settings.LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = settings.LLM_CACHE_DIR / f"{key}.txt"
+    # Write-then-rename so a concurrent reader never sees a partial reply
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(reply, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# Process-wide cap on in-flight requests so concurrent section calls (and
+# concurrent pipeline runs) stay inside provider rate limits.
+_inflight = threading.BoundedSemaphore(settings.LLM_MAX_CONCURRENCY)
+
+
+# ─────────────────────────────────────────────
+# Rate limiting & retries
+# ─────────────────────────────────────────────
+
+class _RateLimiter:
+    """Space request starts at least ``60 / rpm`` seconds apart (0 = off)."""
+
+    def __init__(self, rpm: int):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_rate_limiter = _RateLimiter(settings.LLM_RPM)
+
+
+def _is_refused(exc: Optional[BaseException]) -> bool:
+    """True if a connection was refused anywhere in *exc*'s cause chain."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, ConnectionRefusedError):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _is_transient(exc: Exception) -> bool:
+    """
+    429s, 5xx and network failures are worth retrying; anything else is
+    not.  A refused connection means nothing is listening (e.g. Ollama not
+    started), so it is reported straight away instead of retried.
+    """
+    if _is_refused(exc):
+        return False
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return isinstance(exc, (ConnectionError, TimeoutError, httpx.TransportError)) or (
+        type(exc).__name__ in ("APIConnectionError", "APITimeoutError")
+    )
+
+
+def _retry_delay(attempt: int, label: str, exc: Exception) -> float:
+    delay = settings.LLM_RETRY_BASE_DELAY * (2 ** attempt)
+    logger.warning(
+        "LLM [%s] transient failure (%s), retrying in %.0fs (attempt %d/%d)…",
+        label, exc, delay, attempt + 1, settings.LLM_MAX_RETRIES,
+    )
+    return delay
+
+
+def _call_with_retries(fn: Callable[[], str], label: str) -> str:
+    """
+    Run *fn* under the rate limiter and the in-flight cap, retrying
+    transient failures with backoff.  The cap is only held while a request
+    is actually in flight, never across a backoff sleep.
+    """
+    for attempt in range(settings.LLM_MAX_RETRIES + 1):
+        _rate_limiter.wait()
+        try:
+            with _inflight:
+                return fn()
+        except Exception as exc:
+            if attempt == settings.LLM_MAX_RETRIES or not _is_transient(exc):
+                raise
+            time.sleep(_retry_delay(attempt, label, exc))
+    raise AssertionError("unreachable")
+
+
+def _resolve(
+    backend: Optional[str],
+    temperature: Optional[float],
+    max_tokens: Optional[int],
+) -> tuple[str, str, float, int]:
+    """Fill in config defaults and validate the backend name."""
+    backend = (backend or settings.LLM_BACKEND).lower()
+    temperature = temperature if temperature is not None else settings.LLM_TEMPERATURE
+    max_tokens = max_tokens if max_tokens is not None else settings.LLM_MAX_TOKENS
+
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown LLM backend '{backend}'. "
+            f"Choose from: {', '.join(_BACKENDS)}"
+        )
+    return backend, _BACKENDS[backend][1](), temperature, max_tokens
+
+
 def query_llm(
     messages: list[Message],
     backend: Optional[str] = None,
@@ -174,7 +473,7 @@ def query_llm(
     messages : list[Message]
         OpenAI-style message dicts with ``role`` and ``content`` keys.
     backend : str, optional
-        Override ``config.LLM_BACKEND`` for this call.
+        Override ``settings.LLM_BACKEND`` for this call.
     temperature : float, optional
         Sampling temperature (default from config).
     max_tokens : int, optional
@@ -185,22 +484,128 @@ def query_llm(
     str
         The model's reply text.
     """
-    backend = (backend or config.LLM_BACKEND).lower()
-    temperature = temperature if temperature is not None else config.LLM_TEMPERATURE
-    max_tokens = max_tokens if max_tokens is not None else config.LLM_MAX_TOKENS
-
-    if backend not in _BACKENDS:
-        raise ValueError(
-            f"Unknown LLM backend '{backend}'. "
-            f"Choose from: {', '.join(_BACKENDS)}"
-        )
+    backend, model, temperature, max_tokens = _resolve(backend, temperature, max_tokens)
+    fn = _BACKENDS[backend][0]
 
-    fn, model_getter = _BACKENDS[backend]
-    model = model_getter()
+    key = None
+    if settings.LLM_CACHE_ENABLED:
+        key = _cache_key(backend, model, temperature, max_tokens, messages)
+        cached = _cache_get(key)
+        if cached is not None:
+            logger.info("LLM [%s/%s] cache hit (%d chars)", backend, model, len(cached))
+            return cached
 
     logger.info("LLM [%s/%s] ← %d messages", backend, model, len(messages))
 
-    reply = fn(messages, model, temperature, max_tokens)
+    reply = _call_with_retries(
+        lambda: fn(messages, model, temperature, max_tokens), f"{backend}/{model}",
+    )
+
+    if key is not None:
+        _cache_put(key, reply)
 
     logger.info("LLM [%s/%s] → %d chars", backend, model, len(reply))
     return reply
+
+
+def warm_up(backend: Optional[str] = None) -> None:
+    """
+    Get the backend ready before the first real request.  For Ollama this
+    loads the model weights (an empty ``/api/generate``) and pins them for
+    ``OLLAMA_KEEP_ALIVE``; hosted backends only need their client built.
+    Failures are logged, not raised — the real call will report them.
+    """
+    try:
+        backend, model, _, _ = _resolve(backend, None, None)
+    except ValueError:
+        return  # unknown backend: the real call raises with the full message
+    try:
+        if backend == "ollama":
+            _ollama_client.post(
+                "/api/generate",
+                content=orjson.dumps({"model": model, "keep_alive": settings.OLLAMA_KEEP_ALIVE}),
+            ).raise_for_status()
+        else:
+            {"groq": _groq_client, "openai": _openai_client, "anthropic": _anthropic_client}[backend]()
+        logger.info("LLM [%s/%s] warmed up", backend, model)
+    except Exception as exc:
+        logger.warning("LLM [%s/%s] warm-up failed: %s", backend, model, exc)
+
+
+def query_llm_stream(
+    messages: list[Message],
+    backend: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Like ``query_llm`` but yield the reply incrementally as the model
+    generates it.  Joined chunks equal the ``query_llm`` reply up to
+    surrounding whitespace; a cache hit is yielded as a single chunk.
+    """
+    backend, model, temperature, max_tokens = _resolve(backend, temperature, max_tokens)
+
+    key = None
+    if settings.LLM_CACHE_ENABLED:
+        key = _cache_key(backend, model, temperature, max_tokens, messages)
+        cached = _cache_get(key)
+        if cached is not None:
+            logger.info("LLM [%s/%s] cache hit (%d chars)", backend, model, len(cached))
+            yield cached
+            return
+
+    logger.info("LLM [%s/%s] ← %d messages (streaming)", backend, model, len(messages))
+
+    parts: list[str] = []
+    for attempt in range(settings.LLM_MAX_RETRIES + 1):
+        _rate_limiter.wait()
+        try:
+            with _inflight:
+                for delta in _STREAM_BACKENDS[backend](messages, model, temperature, max_tokens):
+                    parts.append(delta)
+                    yield delta
+            break
+        except Exception as exc:
+            # Text already handed to the caller cannot be taken back
+            if parts or attempt == settings.LLM_MAX_RETRIES or not _is_transient(exc):
+                raise
+            # The in-flight slot was released on the way out of the block
+            time.sleep(_retry_delay(attempt, f"{backend}/{model}", exc))
+
+    reply = "".join(parts).strip()
+    logger.info("LLM [%s/%s] → %d chars", backend, model, len(reply))
+    if key is not None:
+        _cache_put(key, reply)
+
+
+def query_llm_batch(
+    message_lists: list[list[Message]],
+    backend: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    on_result: Optional[Callable[[int, str], None]] = None,
+) -> list[str]:
+    """
+    Run several independent prompts and return the replies in input order.
+
+    None of the chat endpoints accept multiple conversations per request,
+    so the batch is issued as concurrent ``query_llm`` calls (bounded by
+    ``settings.LLM_MAX_CONCURRENCY``).  ``on_result(index, reply)`` fires
+    as each reply lands, in completion order.
+    """
+    replies: list[str] = [""] * len(message_lists)
+    if not message_lists:
+        return replies
+
+    workers = min(settings.LLM_MAX_CONCURRENCY, len(message_lists))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(query_llm, messages, backend, temperature, max_tokens): idx
+            for idx, messages in enumerate(message_lists)
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            replies[idx] = future.result()
+            if on_result:
+                on_result(idx, replies[idx])
+    return replies
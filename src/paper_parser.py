@@ -11,16 +11,22 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
+import os
 import re
+import shutil
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import fitz  # PyMuPDF
 import requests
 
-import config
+from config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -37,54 +43,36 @@ SECTION_ORDER = [
     "conclusion",
 ]
 
-# Patterns used to detect section headings (case-insensitive)
-_HEADING_PATTERNS: list[tuple[str, re.Pattern]] = [
-    ("abstract", re.compile(r"^\s*abstract\s*$", re.I)),
-    ("introduction", re.compile(r"^\s*\d*\.?\s*introduction\s*$", re.I)),
+# Words that make up a section heading, in match priority order.  Every
+# heading but the abstract may carry a section number ("3.", "4 ").
+_HEADING_KEYWORDS: list[tuple[str, str]] = [
+    ("introduction", r"introduction"),
     (
         "methodology",
-        re.compile(
-            r"^\s*\d*\.?\s*(method(ology|s)?|approach|model|framework|proposed\s+(method|approach|system))\s*$",
-            re.I,
-        ),
-    ),
-    (
-        "results",
-        re.compile(
-            r"^\s*\d*\.?\s*(results?|experiments?|evaluation|findings)\s*$", re.I
-        ),
-    ),
-    (
-        "discussion",
-        re.compile(
-            r"^\s*\d*\.?\s*(discussion|analysis|limitations?)\s*$", re.I
-        ),
+        r"method(?:ology|s)?|approach|model|framework|proposed\s+(?:method|approach|system)",
     ),
+    ("results", r"results?|experiments?|evaluation|findings"),
+    ("discussion", r"discussion|analysis|limitations?"),
     (
         "conclusion",
-        re.compile(
-            r"^\s*\d*\.?\s*(conclusion|conclusions|summary|concluding\s+remarks|future\s+work)\s*$",
-            re.I,
-        ),
-    ),
-    (
-        "references",
-        re.compile(
-            r"^\s*\d*\.?\s*(references|bibliography)\s*$", re.I
-        ),
-    ),
-    (
-        "appendix",
-        re.compile(r"^\s*\d*\.?\s*(appendix|appendices|supplementary)\s*$", re.I),
-    ),
-    (
-        "related_work",
-        re.compile(r"^\s*\d*\.?\s*(related\s+work|background|literature\s+review|prior\s+work)\s*$", re.I),
+        r"conclusion|conclusions|summary|concluding\s+remarks|future\s+work",
     ),
+    ("references", r"references|bibliography"),
+    ("appendix", r"appendix|appendices|supplementary"),
+    ("related_work", r"related\s+work|background|literature\s+review|prior\s+work"),
 ]
 
+# All heading patterns in one alternation; ``lastgroup`` names the section
+# (case-insensitive).
+_HEADING_RE = re.compile(
+    r"^\s*(?:(?P<abstract>abstract)|\d*\.?\s*(?:"
+    + "|".join(f"(?P<{key}>{words})" for key, words in _HEADING_KEYWORDS)
+    + r"))\s*$",
+    re.I,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class PaperSections:
     """Container for the structured output of the parser."""
     title: str = ""
@@ -96,70 +84,308 @@ class PaperSections:
     results: str = ""
     discussion: str = ""
     conclusion: str = ""
-    raw_text: str = ""
     latex_expressions: list[str] = field(default_factory=list)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────
 
-def _arxiv_url_to_pdf(url_or_id: str) -> str:
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5})(v\d+)?")
+_OLD_ARXIV_ID_RE = re.compile(r"([a-z\-]+/\d{7})(v\d+)?")  # e.g. hep-ph/0301200
+
+
+def _arxiv_url_to_pdf(url_or_id: str) -> tuple[str, Optional[str]]:
     """
     Normalise an arXiv URL or plain ID (e.g. '2301.07041') into
-    a direct PDF download link.
+    a direct PDF download link and the paper ID it was built from
+    (``None`` when a direct PDF link outside arXiv was given).
     """
     # Strip trailing whitespace / slashes
     url_or_id = url_or_id.strip().rstrip("/")
 
-    # Already a direct PDF link
-    if url_or_id.endswith(".pdf"):
-        return url_or_id
+    # Direct PDF link to some other host
+    if url_or_id.endswith(".pdf") and "arxiv.org" not in url_or_id:
+        return url_or_id, None
 
-    # Extract the ID from various URL forms
-    match = re.search(r"(\d{4}\.\d{4,5})(v\d+)?", url_or_id)
+    # Extract the ID from various URL forms (including arXiv PDF links)
+    match = _ARXIV_ID_RE.search(url_or_id)
     if match:
         paper_id = match.group(0)
-        return f"https://arxiv.org/pdf/{paper_id}.pdf"
+        return f"https://arxiv.org/pdf/{paper_id}.pdf", paper_id
 
     # Old-style IDs  (e.g. hep-ph/0301200)
-    match = re.search(r"([a-z\-]+/\d{7})", url_or_id)
+    match = _OLD_ARXIV_ID_RE.search(url_or_id)
     if match:
-        paper_id = match.group(1)
-        return f"https://arxiv.org/pdf/{paper_id}.pdf"
+        paper_id = match.group(0)
+        return f"https://arxiv.org/pdf/{paper_id}.pdf", paper_id
 
     raise ValueError(f"Cannot parse arXiv identifier from: {url_or_id}")
 
 
+_PDF_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_pdf_chunks(pdf_url: str) -> Iterator[bytes]:
+    """
+    Stream the PDF in 64 KB chunks.  The first chunk is checked for the
+    ``%PDF`` magic so an HTML error / access-denied page fails fast
+    instead of being handed to PyMuPDF.
+    """
+    with requests.get(pdf_url, stream=True, timeout=60) as resp:
+        resp.raise_for_status()
+        first = True
+        for chunk in resp.iter_content(chunk_size=_PDF_CHUNK_SIZE):
+            if not chunk:
+                continue
+            if first and not chunk.startswith(b"%PDF"):
+                raise ValueError(
+                    f"{pdf_url} did not return a PDF "
+                    f"(Content-Type: {resp.headers.get('Content-Type', 'unknown')})"
+                )
+            first = False
+            yield chunk
+
+
+# ── PDF cache ────────────────────────────────────────────────────────
+# Downloaded PDFs are kept on disk keyed by paper ID, so re-running a
+# paper skips the network entirely.  Only versioned IDs (2301.07041v2)
+# are cached: an unversioned ID means "latest", which changes whenever
+# the authors post a new version.
+
+def _pdf_cache_path(paper_id: Optional[str]) -> Optional[Path]:
+    if paper_id is None or not settings.PDF_CACHE_ENABLED:
+        return None
+    if not re.search(r"v\d+$", paper_id):
+        return None
+    # Old-style IDs contain a slash (hep-ph/0301200)
+    return settings.PDF_CACHE_DIR / f"{paper_id.replace('/', '_')}.pdf"
+
+
+def _pdf_cache_touch(path: Path) -> None:
+    try:
+        os.utime(path)  # mark as recently used for eviction
+    except OSError:
+        pass
+
+
+def _pdf_cache_get(path: Path) -> Optional[bytes]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    if not data.startswith(b"%PDF"):
+        return None
+    _pdf_cache_touch(path)
+    return data
+
+
+def _pdf_cache_has(path: Path) -> bool:
+    try:
+        with path.open("rb") as fh:
+            if fh.read(4) != b"%PDF":
+                return False
+    except FileNotFoundError:
+        return False
+    _pdf_cache_touch(path)
+    return True
+
+
+def _pdf_cache_put(path: Path, chunks: Iterable[bytes]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so a concurrent reader never sees a partial PDF
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open("wb") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _prune_pdf_cache(keep=path)
+
+
+def _prune_pdf_cache(keep: Path) -> None:
+    """Evict least recently used PDFs, never *keep*, down to ``PDF_CACHE_MAX_MB``."""
+    try:
+        entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                   for e in os.scandir(settings.PDF_CACHE_DIR)
+                   if e.is_file() and e.name.endswith(".pdf")]
+    except FileNotFoundError:
+        return
+    excess = sum(size for _, size, _ in entries) - settings.PDF_CACHE_MAX_MB * 1024 * 1024
+    for _, size, path in sorted(entries):
+        if excess <= 0:
+            break
+        if Path(path) == keep:
+            continue
+        Path(path).unlink(missing_ok=True)
+        excess -= size
+
+
 def download_pdf(url_or_id: str, dest: Optional[Path] = None) -> Path:
-    """Download the PDF and return the local file path."""
-    pdf_url = _arxiv_url_to_pdf(url_or_id)
-    resp = requests.get(pdf_url, timeout=60)
-    resp.raise_for_status()
+    """
+    Download the PDF and return the local file path.  With the PDF cache
+    enabled and no *dest*, that path is the cached copy itself.
+    """
+    pdf_url, paper_id = _arxiv_url_to_pdf(url_or_id)
+    cached = _pdf_cache_path(paper_id)
+    if cached is not None:
+        if not _pdf_cache_has(cached):
+            _pdf_cache_put(cached, _iter_pdf_chunks(pdf_url))
+        if dest is None:
+            return cached
+        shutil.copyfile(cached, dest)
+        return dest
 
     if dest is None:
         tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
         dest = Path(tmp.name)
         tmp.close()
 
-    dest.write_bytes(resp.content)
+    try:
+        with dest.open("wb") as fh:
+            for chunk in _iter_pdf_chunks(pdf_url):
+                fh.write(chunk)
+    except BaseException:
+        dest.unlink(missing_ok=True)
+        raise
     return dest
 
 
+def _fetch_pdf_bytes(url_or_id: str) -> bytes:
+    """Download the PDF into memory, for when no file needs to be kept."""
+    pdf_url, paper_id = _arxiv_url_to_pdf(url_or_id)
+    cached = _pdf_cache_path(paper_id)
+    if cached is not None:
+        data = _pdf_cache_get(cached)
+        if data is not None:
+            logger.info("Using cached PDF %s", cached)
+            return data
+
+    buf = bytearray()
+    for chunk in _iter_pdf_chunks(pdf_url):
+        buf += chunk
+    data = bytes(buf)
+
+    if cached is not None:
+        try:
+            _pdf_cache_put(cached, (data,))
+        except OSError as exc:
+            logger.warning("Could not cache %s: %s", cached, exc)
+    return data
+
+
 # ── Text extraction ──────────────────────────────────────────────────
 
-def _extract_text_from_pdf(pdf_path: Path) -> str:
+# Workers are forked from a single-threaded fork server, never from the
+# caller: extraction runs on API worker threads while other threads hold
+# locks (MuPDF, HTTP clients), and a child forked mid-lock can deadlock.
+# The server imports this module once, so each worker still starts in
+# milliseconds.  Where there is no fork server (Windows), spawn instead.
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _POOL_CONTEXT = multiprocessing.get_context("forkserver")
+    _POOL_CONTEXT.set_forkserver_preload([__name__])
+else:
+    _POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _open_pdf(pdf: Path | bytes) -> fitz.Document:
+    if isinstance(pdf, Path):
+        return fitz.open(str(pdf))
+    return fitz.open(stream=pdf, filetype="pdf")
+
+
+def _extract_page_range(pdf: Path | bytes, start: int, stop: int) -> list[str]:
+    """Extract pages ``[start, stop)`` with a document handle of our own."""
+    doc = _open_pdf(pdf)
+    try:
+        # sort=True reorders blocks top-to-bottom, left-to-right
+        # which helps with two-column papers
+        return [doc.load_page(i).get_text("text", sort=True) for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
+# Whole-line methods / references headings inside a page of raw text
+_METHODS_HEADING_RE = re.compile(
+    rf"^[^\S\n]*\d*\.?[^\S\n]*(?:{dict(_HEADING_KEYWORDS)['methodology']})[^\S\n]*$",
+    re.I | re.M,
+)
+_REFERENCES_HEADING_RE = re.compile(
+    rf"^[^\S\n]*\d*\.?[^\S\n]*(?:{dict(_HEADING_KEYWORDS)['references']})[^\S\n]*$",
+    re.I | re.M,
+)
+
+
+def _extract_until_references(doc: fitz.Document, page_count: int) -> list[str]:
     """
-    Extract text via PyMuPDF using the 'text' extraction mode,
-    which handles multi-column layouts better than raw char extraction.
+    Extract pages in order, stopping after the page whose text opens the
+    reference list (for PDFs without an outline), under the same
+    methods-first rule as ``_reference_list_page``.
     """
-    doc = fitz.open(str(pdf_path))
     pages: list[str] = []
-    for page in doc:
+    seen_methods = False
+    for i in range(page_count):
         # sort=True reorders blocks top-to-bottom, left-to-right
         # which helps with two-column papers
-        text = page.get_text("text", sort=True)
+        text = doc.load_page(i).get_text("text", sort=True)
         pages.append(text)
+        refs = _REFERENCES_HEADING_RE.search(text)
+        if not seen_methods:
+            end = refs.start() if refs else len(text)
+            seen_methods = _METHODS_HEADING_RE.search(text, 0, end) is not None
+        if refs and seen_methods:
+            break
+    return pages
+
+
+def _reference_list_page(doc: fitz.Document) -> Optional[int]:
+    """
+    1-based page where the reference list starts, read from the PDF
+    outline.  Only trusted once a methods section has come before it —
+    Nature-style papers put Methods *after* the references.
+    """
+    seen_methods = False
+    for _, title, page in doc.get_toc():
+        title = title.strip()
+        if _METHODS_HEADING_RE.match(title):
+            seen_methods = True
+        elif _REFERENCES_HEADING_RE.match(title):
+            return page if seen_methods and page > 0 else None
+    return None
+
+
+def _extract_text_from_pdf(pdf: Path | bytes) -> str:
+    """
+    Extract text via PyMuPDF using the 'text' extraction mode,
+    which handles multi-column layouts better than raw char extraction.
+
+    Pages after the one where the reference list starts are skipped —
+    the section splitter discards them anyway.
+
+    *pdf* is either a file path or the raw PDF bytes.  Long papers are
+    split into page ranges extracted in parallel worker processes —
+    PyMuPDF is not thread-safe, even across separate documents.
+    """
+    doc = _open_pdf(pdf)
+    page_count = _reference_list_page(doc) or doc.page_count
+    workers = min(
+        settings.PDF_EXTRACT_WORKERS or os.cpu_count() or 1,
+        page_count // settings.PDF_PAGES_PER_WORKER,
+    )
+    if workers <= 1:
+        try:
+            return "\n".join(_extract_until_references(doc, page_count))
+        finally:
+            doc.close()
     doc.close()
-    return "\n".join(pages)
+
+    bounds = [page_count * k // workers for k in range(workers + 1)]
+    with ProcessPoolExecutor(workers, mp_context=_POOL_CONTEXT) as pool:
+        chunks = pool.map(
+            _extract_page_range, [pdf] * workers, bounds[:-1], bounds[1:],
+        )
+        return "\n".join(text for chunk in chunks for text in chunk)
 
 
 # ── Cleaning helpers ─────────────────────────────────────────────────
@@ -169,8 +395,8 @@ _FIGURE_REF_RE = re.compile(
     r"(Fig(ure|\.)?|Table|Eq(uation|\.)?)\s*\.?\s*\d+(\.\d+)*[a-z]?",
     re.I,
 )
-_LATEX_INLINE_RE = re.compile(r"\$([^$]+)\$")              # $...$
-_LATEX_DISPLAY_RE = re.compile(r"\$\$(.+?)\$\$", re.S)    # $$...$$
+# $$...$$ (display) or $...$ (inline); display is tried first at each "$"
+_LATEX_RE = re.compile(r"\$\$(?P<display>.+?)\$\$|\$(?P<inline>[^$]+)\$", re.S)
 _HEADER_FOOTER_RE = re.compile(
     r"^(arXiv:\d{4}\.\d{4,5}|Preprint\.?\s*Under\s+review|Published\s+.+).*$",
     re.I | re.M,
@@ -178,6 +404,16 @@ _HEADER_FOOTER_RE = re.compile(
 _MULTIPLE_NEWLINES = re.compile(r"\n{3,}")
 _MULTIPLE_SPACES = re.compile(r"[ \t]{2,}")
 
+# Header/footer, citation and figure-ref removal fused into one pass.  The
+# lookahead lists every character a match can start with, so positions
+# that cannot begin one are rejected before any branch is tried.
+_NOISE_RE = re.compile(
+    r"(?=[\[APFTEapfte])(?:"
+    + "|".join(f"(?:{p.pattern})" for p in (_HEADER_FOOTER_RE, _CITATION_RE, _FIGURE_REF_RE))
+    + ")",
+    re.I | re.M,
+)
+
 
 def _extract_latex(text: str) -> tuple[str, list[str]]:
     """
@@ -187,21 +423,17 @@ def _extract_latex(text: str) -> tuple[str, list[str]]:
     expressions: list[str] = []
 
     def _replace(m: re.Match) -> str:
-        expr = m.group(1).strip()
+        expr = m.group(m.lastgroup).strip()
         idx = len(expressions)
         expressions.append(expr)
         return f" <<LATEX:{idx}>> "
 
-    text = _LATEX_DISPLAY_RE.sub(_replace, text)
-    text = _LATEX_INLINE_RE.sub(_replace, text)
-    return text, expressions
+    return _LATEX_RE.sub(_replace, text), expressions
 
 
 def _clean_text(text: str) -> str:
     """Remove citations, figure refs, headers/footers, normalise whitespace."""
-    text = _HEADER_FOOTER_RE.sub("", text)
-    text = _CITATION_RE.sub("", text)
-    text = _FIGURE_REF_RE.sub("", text)
+    text = _NOISE_RE.sub("", text)
     text = _MULTIPLE_SPACES.sub(" ", text)
     text = _MULTIPLE_NEWLINES.sub("\n\n", text)
     return text.strip()
@@ -209,17 +441,23 @@ def _clean_text(text: str) -> str:
 
 # ── Section splitting ────────────────────────────────────────────────
 
+_NUMBERED_HEADING_RE = re.compile(r"^\s*\d+\.?\s+\S")
+
+
 def _identify_heading(line: str) -> Optional[str]:
     """Return the canonical section key if *line* looks like a heading."""
     stripped = line.strip()
     # Headings are usually short
     if len(stripped) > 80:
         return None
-    for key, pat in _HEADING_PATTERNS:
-        if pat.match(stripped):
-            return key
+    # Every heading starts with a section number, a dot or a letter
+    if not stripped or not (stripped[0].isalnum() or stripped[0] == "."):
+        return None
+    m = _HEADING_RE.match(stripped)
+    if m:
+        return m.lastgroup
     # Catch generic numbered section headings (e.g. "2. Data" → methodology)
-    if re.match(r'^\s*\d+\.?\s+\S', stripped) and len(stripped) < 60:
+    if len(stripped) < 60 and _NUMBERED_HEADING_RE.match(stripped):
         return _guess_section_key(stripped)
     return None
 
@@ -252,8 +490,16 @@ _SECTION_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+@lru_cache(maxsize=256)
 def _guess_section_key(heading_text: str) -> Optional[str]:
-    """Map an unrecognised numbered heading to the best canonical key."""
+    """
+    Map an unrecognised numbered heading to the best canonical key.
+
+    Memoised: a line near the top can be classified by both the
+    front-matter heuristic and the heading scan, and common numbered
+    headings ("2. Data", "4. Experiments") recur across the papers a
+    long-running server parses.
+    """
     lower = heading_text.lower()
     best_key: Optional[str] = None
     best_score = 0
@@ -265,6 +511,30 @@ def _guess_section_key(heading_text: str) -> Optional[str]:
     return best_key if best_score > 0 else "methodology"  # safe default for unknown sections
 
 
+# Every line ``_identify_heading`` accepts, found in one scan: the same
+# length limits (80 / 60 chars once stripped), first-character check and
+# heading patterns, kept within one line.  Matches start at the newline
+# before the heading — a literal first character lets the regex engine
+# jump from line to line — so the scanned text must begin with "\n".
+_PAD = r"[^\S\n]"
+_HEADING_LINE_RE = re.compile(
+    rf"\n{_PAD}*(?=[^\W_]|\.)(?![^\n]{{80}}{_PAD}*\S)(?:"
+    rf"(?:(?P<abstract>abstract)|\d*\.?{_PAD}*(?:"
+    + "|".join(f"(?P<{key}>{words})" for key, words in _HEADING_KEYWORDS).replace(r"\s", _PAD)
+    + rf")){_PAD}*$"
+    rf"|(?P<numbered>(?![^\n]{{59}}{_PAD}*\S)\d+\.?{_PAD}+\S[^\n]*?){_PAD}*$"
+    r")",
+    re.I | re.M,
+)
+
+
+def _heading_key(m: re.Match) -> str:
+    """Canonical section key for a ``_HEADING_LINE_RE`` match."""
+    if m.lastgroup == "numbered":
+        return _guess_section_key(m.group("numbered"))
+    return m.lastgroup
+
+
 # ── LLM-based front-matter extraction ────────────────────────────────
 
 _FRONT_MATTER_PROMPT = """You are an expert at parsing academic papers.
@@ -285,6 +555,9 @@ Return ONLY a valid JSON object with exactly these keys:
 
 No extra text, no markdown fencing, just the JSON object."""
 
+_CODE_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*")
+_CODE_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+
 
 def _extract_front_matter_llm(raw_text: str) -> dict[str, str]:
     """
@@ -310,8 +583,8 @@ def _extract_front_matter_llm(raw_text: str) -> dict[str, str]:
         # Strip markdown fencing if the model wraps it
         reply = reply.strip()
         if reply.startswith("```"):
-            reply = re.sub(r"^```(?:json)?\s*", "", reply)
-            reply = re.sub(r"\s*```$", "", reply)
+            reply = _CODE_FENCE_OPEN_RE.sub("", reply)
+            reply = _CODE_FENCE_CLOSE_RE.sub("", reply)
         result = json.loads(reply)
         logger.info("LLM front-matter extraction succeeded")
         return {
@@ -338,7 +611,8 @@ def _extract_title_authors_heuristic(lines: list[str]) -> tuple[str, str, int]:
         stripped = line.strip()
         consumed = i
 
-        if _identify_heading(stripped) is not None:
+        # Blank lines are never headings; skip the call for them
+        if stripped and _identify_heading(stripped) is not None:
             break
 
         if phase == "title":
@@ -357,12 +631,26 @@ def _extract_title_authors_heuristic(lines: list[str]) -> tuple[str, str, int]:
     return title, authors, consumed
 
 
-def _find_abstract_line(lines: list[str]) -> int:
+# A line holding only "Abstract"; [^\S\n] keeps the padding on that line
+_ABSTRACT_LINE_RE = re.compile(r"^[^\S\n]*abstract[^\S\n]*$", re.I | re.M)
+
+
+def _find_abstract_line(text: str) -> int:
     """Return the line index where the abstract heading appears, or -1."""
-    for i, line in enumerate(lines):
-        if re.match(r'^\s*abstract\s*$', line.strip(), re.I):
-            return i
-    return -1
+    m = _ABSTRACT_LINE_RE.search(text)
+    if m is None:
+        return -1
+    return text.count("\n", 0, m.start())
+
+
+def _line_start(text: str, index: int) -> int:
+    """Offset of line *index* in *text* (``len(text)`` past the end)."""
+    pos = 0
+    for _ in range(index):
+        pos = text.find("\n", pos) + 1
+        if not pos:
+            return len(text)
+    return pos
 
 
 def _split_into_sections(
@@ -370,16 +658,14 @@ def _split_into_sections(
     raw_text: str = "",
 ) -> dict[str, str]:
     """
-    Walk through lines, detect headings, and collect text under each
-    heading into a dict keyed by canonical section name.
+    Find every heading line, and collect the text under each heading
+    into a dict keyed by canonical section name.
 
     Uses the LLM to robustly extract title / authors / abstract from
     the raw (uncleaned) front matter.  Falls back to a heuristic if
     the LLM call fails.
     """
-    lines = text.split("\n")
     sections: dict[str, list[str]] = {}
-    current_key: Optional[str] = None
 
     # ── Front-matter: title, authors, abstract via LLM ──
     front = _extract_front_matter_llm(raw_text or text)
@@ -389,46 +675,35 @@ def _split_into_sections(
         sections["authors"] = [front.get("authors", "")]
         if front.get("abstract"):
             sections["abstract"] = [front["abstract"]]
-        # Figure out where to start scanning body sections.
-        # Skip past the abstract heading + its content.
-        abs_idx = _find_abstract_line(lines)
-        if abs_idx >= 0:
-            skip_to = abs_idx + 1  # heading detection loop will grab abstract content
-            # If LLM already gave us abstract, skip past it entirely
-            if front.get("abstract"):
-                # Advance past blank lines + abstract body to next heading
-                for j in range(abs_idx + 1, len(lines)):
-                    if _identify_heading(lines[j]) and _identify_heading(lines[j]) != "abstract":
-                        skip_to = j
-                        break
-                else:
-                    skip_to = abs_idx + 1
-        else:
-            skip_to = 0
+        # Start scanning body sections after the abstract heading; the
+        # heading loop grabs the abstract content unless the LLM gave it.
+        abs_idx = _find_abstract_line(text)
+        skip_to = abs_idx + 1 if abs_idx >= 0 else 0
     else:
         # LLM failed → use heuristic
         logger.info("Falling back to heuristic title/author extraction")
-        title, authors, skip_to = _extract_title_authors_heuristic(lines)
+        title, authors, skip_to = _extract_title_authors_heuristic(text.split("\n"))
         sections["title"] = [title]
         sections["authors"] = [authors]
 
-    for line in lines[skip_to:]:
-        heading = _identify_heading(line)
-        if heading:
-            # Don't keep references or appendix content
-            if heading in ("references", "appendix"):
-                current_key = None
-                continue
-            current_key = heading
-            # Don't overwrite LLM-extracted abstract
-            if heading == "abstract" and "abstract" in sections:
-                current_key = None
-                continue
-            sections.setdefault(current_key, [])
+    # Find every heading in one scan, then take each section body as one
+    # slice running up to the next heading (text before the first is
+    # dropped).
+    body = "\n" + text[_line_start(text, skip_to):]
+    marks = list(_HEADING_LINE_RE.finditer(body))
+    ends = [m.start() for m in marks[1:]] + [len(body)]
+    for m, end in zip(marks, ends):
+        heading = _heading_key(m)
+        # Don't keep references or appendix content
+        if heading in ("references", "appendix"):
             continue
-
-        if current_key is not None:
-            sections.setdefault(current_key, []).append(line)
+        # Don't overwrite LLM-extracted abstract
+        if heading == "abstract" and "abstract" in sections:
+            continue
+        chunks = sections.setdefault(heading, [])
+        # m.end() is the newline closing the heading line
+        if m.end() < end:
+            chunks.append(body[m.end() + 1 : end])
 
     return {k: "\n".join(v).strip() for k, v in sections.items()}
 
@@ -451,13 +726,11 @@ def parse_paper(url_or_id: str, keep_pdf: bool = False) -> PaperSections:
     -------
     PaperSections
     """
-    pdf_path = download_pdf(url_or_id)
-
-    try:
-        raw_text = _extract_text_from_pdf(pdf_path)
-    finally:
-        if not keep_pdf:
-            pdf_path.unlink(missing_ok=True)
+    if keep_pdf:
+        raw_text = _extract_text_from_pdf(download_pdf(url_or_id))
+    else:
+        # Nothing to keep on disk, so skip the temp-file round trip
+        raw_text = _extract_text_from_pdf(_fetch_pdf_bytes(url_or_id))
 
     # Extract and tag LaTeX before any other cleaning
     text_with_tags, latex_exprs = _extract_latex(raw_text)
@@ -475,7 +748,6 @@ def parse_paper(url_or_id: str, keep_pdf: bool = False) -> PaperSections:
         results=section_map.get("results", ""),
         discussion=section_map.get("discussion", ""),
         conclusion=section_map.get("conclusion", ""),
-        raw_text=raw_text,
         latex_expressions=latex_exprs,
     )
     return paper
@@ -15,13 +15,15 @@ can also be run standalone for CLI usage.
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 from typing import Callable, Optional
 
-import config
+from config import settings
 from src.paper_parser import PaperSections, parse_paper
 from src.latex_to_speech import replace_latex_placeholders
 from src.dialogue_generator import generate_script, FullScript
+from src.llm_interface import warm_up
 from src.post_processor import post_process, ProcessedScript
 from src.tts_engine import generate_audio
 
@@ -29,11 +31,14 @@ logger = logging.getLogger(__name__)
 
 
 def _sections_to_dict(paper: PaperSections) -> dict[str, str]:
-    """Convert a PaperSections dataclass into a plain dict for the generator."""
+    """
+    Convert a PaperSections dataclass into a plain dict for the generator.
+    Only sections the generator reads are included, so no LaTeX
+    conversion is spent on the rest (e.g. related work).
+    """
     return {
         "abstract": paper.abstract,
         "introduction": paper.introduction,
-        "related_work": paper.related_work,
         "methodology": paper.methodology,
         "results": paper.results,
         "discussion": paper.discussion,
@@ -63,7 +68,7 @@ def run_pipeline(
     generate_audio_flag : bool
         Whether to run TTS after generating the script.
     output_dir : Path
-        Directory for output files (defaults to ``config.OUTPUT_DIR``).
+        Directory for output files (defaults to ``settings.OUTPUT_DIR``).
     progress_callback : callable
         ``callback(stage, fraction)`` for UI progress updates.
 
@@ -75,7 +80,7 @@ def run_pipeline(
         "transcript_path" → Path
         "audio_path" → Path | None
     """
-    out = output_dir or config.OUTPUT_DIR
+    out = output_dir or settings.OUTPUT_DIR
     out.mkdir(parents=True, exist_ok=True)
 
     def _progress(msg: str, frac: float) -> None:
@@ -83,6 +88,9 @@ def run_pipeline(
         if progress_callback:
             progress_callback(msg, frac)
 
+    # Load the LLM (Ollama weights, SDK client) while the PDF downloads
+    threading.Thread(target=warm_up, args=(llm_backend,), daemon=True).start()
+
     # ── 1. Parse paper ───────────────────────────────────────
     _progress("Downloading and parsing paper…", 0.0)
     paper = parse_paper(arxiv_url)
@@ -91,9 +99,13 @@ def run_pipeline(
     # ── 2. Convert LaTeX → spoken English ────────────────────
     _progress("Converting maths to spoken English…", 0.12)
     sections = _sections_to_dict(paper)
+    # Kept serial: the whole stage is a few ms of GIL-bound regex work, so
+    # a thread or process pool costs more than it saves — and the shared
+    # memo means each expression is only resolved once.
+    spoken: dict[str, str] = {}
     for key in sections:
         sections[key] = replace_latex_placeholders(
-            sections[key], paper.latex_expressions
+            sections[key], paper.latex_expressions, spoken
         )
     paper.abstract = sections["abstract"]
     _progress("LaTeX conversion complete.", 0.15)
@@ -129,7 +141,7 @@ def run_pipeline(
 
         audio_path = generate_audio(
             script=processed,
-            output_path=out / f"podcast.{config.AUDIO_FORMAT}",
+            output_path=out / f"podcast.{settings.AUDIO_FORMAT}",
             engine=tts_engine,
             progress_callback=_tts_progress,
         )
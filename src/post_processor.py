@@ -14,23 +14,42 @@ from __future__ import annotations
 import random
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING
 
-from src.dialogue_generator import FullScript, DialogueSegment
+if TYPE_CHECKING:
+    # Hint only — importing the generator would pull in the LLM layer
+    # (httpx, orjson, client setup) for TTS-only callers.
+    from src.dialogue_generator import FullScript
 
 
 # ─────────────────────────────────────────────
 # Regex patterns for cleaning
 # ─────────────────────────────────────────────
 
-# Matches various speaker labels the LLM might produce
+# Matches various speaker labels the LLM might produce at the start of a
+# line; [^\S\n] keeps the match from running across lines.
 _SPEAKER_RE = re.compile(
-    r"^(Host|HOST|Expert|EXPERT|Interviewer|Guest|Speaker\s*[12AB])\s*[:：]\s*",
+    r"^[^\S\n]*(Host|HOST|Expert|EXPERT|Interviewer|Guest|Speaker[^\S\n]*[12AB])"
+    r"[^\S\n]*[:：][^\S\n]*",
     re.M,
 )
+# Upper-cased label → role; any other label is the expert
+_SPEAKER_ROLES = {
+    "HOST": "HOST",
+    "INTERVIEWER": "HOST",
+    "SPEAKER 1": "HOST",
+    "SPEAKER A": "HOST",
+}
+
+# Joins turn texts so each cleaning pattern runs once over the whole
+# script (SYMBOL FOR RECORD SEPARATOR — not something dialogue contains).
+# The only patterns that could otherwise span it are the LaTeX ones below.
+_TURN_SEP = "\u241e"
 
 # Residual LaTeX fragments
-_LATEX_RESIDUAL = re.compile(r"\\[a-zA-Z]+(\{[^}]*\})*|\$[^$]+\$|\$\$[^$]+\$\$")
+_LATEX_RESIDUAL = re.compile(
+    r"\\[a-zA-Z]+(\{[^}\u241e]*\})*|\$[^$\u241e]+\$|\$\$[^$\u241e]+\$\$"
+)
 
 # Markdown bold/italic/headers
 _MARKDOWN_RE = re.compile(r"(\*{1,3}|_{1,3}|#{1,6}\s)")
@@ -49,6 +68,29 @@ _FIG_REF_RE = re.compile(
     re.I,
 )
 
+# Whitespace / punctuation tidy-up
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_ORPHAN_PUNCT_RE = re.compile(r"\s+([.,;:!?])")
+_DUP_PUNCT_RE = re.compile(r"([.,;:!?]){2,}")
+
+# _clean_turn_text fuses the citation and figure-ref patterns into one
+# pass, guarded by a lookahead on the characters a match can start with.
+# LaTeX and then markdown removal run first, each on its own: removing
+# LaTeX can expose a markdown marker ("#\\alpha value"), and removing
+# markdown can expose a citation ("(Smith *et al.*, 2023)").
+_REFERENCE_RE = re.compile(
+    rf"(?=[\[(AFTEafte])(?:(?:{_CITATION_BRACKETS.pattern})"
+    rf"|(?:{_CITATION_PARENS.pattern})|(?i:{_FIG_REF_RE.pattern}))"
+)
+
+# Anything any _clean_turn_text pass could change: a character that opens
+# a markup / citation match, a figure-ref core, or whitespace/punctuation
+# runs.  Turns without one are left alone.
+_NEEDS_CLEANING_RE = re.compile(
+    r"[\\$*_#\[]|\([A-Z]|\s\s|\s[.,;:!?]|[.,;:!?]{2}"
+    r"|(?i:fig(?:ure|\.)?|table|eq(?:uation|\.)?)\s*\.?\s*\d"
+)
+
 
 # ─────────────────────────────────────────────
 # Conversational fillers (used sparingly)
@@ -72,18 +114,28 @@ _EXPERT_FILLERS = [
 
 _FILLER_INJECTION_PROB = 0.15  # probability of adding a filler per turn
 
+# Lowercased filler openings, for the "already starts with a filler" check
+_FILLER_PREFIXES = {
+    "HOST": tuple(f.lower().rstrip(",. ") for f in _HOST_FILLERS),
+    "EXPERT": tuple(f.lower().rstrip(",. ") for f in _EXPERT_FILLERS),
+}
+_FILLER_PREFIX_LEN = max(map(len, _FILLER_PREFIXES["HOST"] + _FILLER_PREFIXES["EXPERT"]))
+
 
 # ─────────────────────────────────────────────
 # Parsed turn
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     speaker: str   # "HOST" or "EXPERT"
     text: str
 
 
-@dataclass
+_RULE = "─" * 40  # segment divider in the transcript
+
+
+@dataclass(slots=True)
 class ProcessedScript:
     """Final polished script with timestamps and segment markers."""
     title: str
@@ -100,18 +152,24 @@ class ProcessedScript:
         lines.append("=" * 60 + "\n")
 
         # Estimate ~3 seconds per sentence for timestamps
+        append = lines.append
+        markers = self.segment_markers
+        fmt_ts = self._fmt_ts
         elapsed_seconds = 0
         for i, turn in enumerate(self.turns):
-            if i in self.segment_markers:
-                lines.append(f"\n{'─' * 40}")
-                lines.append(f"  [{self._fmt_ts(elapsed_seconds)}] {self.segment_markers[i]}")
-                lines.append(f"{'─' * 40}\n")
-
-            ts = self._fmt_ts(elapsed_seconds)
-            lines.append(f"[{ts}] {turn.speaker}: {turn.text}\n")
-
-            # Rough estimate: 3 sec per sentence
-            num_sentences = max(1, turn.text.count(".") + turn.text.count("?") + turn.text.count("!"))
+            ts = fmt_ts(elapsed_seconds)
+            title = markers.get(i)
+            if title is not None:
+                append(f"\n{_RULE}")
+                append(f"  [{ts}] {title}")
+                append(f"{_RULE}\n")
+
+            text = turn.text
+            append(f"[{ts}] {turn.speaker}: {text}\n")
+
+            # Rough estimate: 3 sec per sentence (three C-level counts beat
+            # a regex findall or translate on turn-sized strings)
+            num_sentences = max(1, text.count(".") + text.count("?") + text.count("!"))
             elapsed_seconds += num_sentences * 3
 
         return "\n".join(lines)
@@ -126,47 +184,48 @@ class ProcessedScript:
 # Cleaning functions
 # ─────────────────────────────────────────────
 
-def _normalise_speaker(line: str) -> Optional[tuple[str, str]]:
-    """
-    Parse a line into (SPEAKER, text). Returns None if the line has no
-    speaker prefix.
-    """
-    m = _SPEAKER_RE.match(line)
-    if not m:
-        return None
-
-    raw_label = m.group(1).strip().upper()
-    text = line[m.end():].strip()
-
-    if raw_label in ("HOST", "INTERVIEWER", "SPEAKER 1", "SPEAKER A"):
-        return "HOST", text
-    return "EXPERT", text
-
-
 def _clean_turn_text(text: str) -> str:
     """Remove LaTeX residue, markdown, citations, and figure refs from a turn."""
     text = _LATEX_RESIDUAL.sub("", text)
     text = _MARKDOWN_RE.sub("", text)
-    text = _CITATION_BRACKETS.sub("", text)
-    text = _CITATION_PARENS.sub("", text)
-    text = _FIG_REF_RE.sub("", text)
+    text = _REFERENCE_RE.sub("", text)
     # Collapse multiple spaces / orphaned punctuation
-    text = re.sub(r"\s{2,}", " ", text)
-    text = re.sub(r"\s+([.,;:!?])", r"\1", text)
-    text = re.sub(r"([.,;:!?]){2,}", r"\1", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
+    text = _ORPHAN_PUNCT_RE.sub(r"\1", text)
+    text = _DUP_PUNCT_RE.sub(r"\1", text)
     return text.strip()
 
 
+def _clean_turn_texts(turns: list[Turn]) -> None:
+    """
+    Clean every turn's text in place.  Turns with nothing to clean are
+    only stripped; the rest are joined on ``_TURN_SEP`` and cleaned in one
+    batch rather than running each pattern per turn.
+    """
+    dirty = [t for t in turns if _NEEDS_CLEANING_RE.search(t.text)]
+    for t in turns:
+        t.text = t.text.strip()
+    if not dirty:
+        return
+    parts = _clean_turn_text(_TURN_SEP.join(t.text for t in dirty)).split(_TURN_SEP)
+    if len(parts) != len(dirty):
+        # A turn contained the separator itself — clean one by one
+        parts = [_clean_turn_text(t.text) for t in dirty]
+    for t, text in zip(dirty, parts):
+        t.text = text.strip()
+
+
 def _maybe_inject_filler(turn: Turn, rng: random.Random) -> Turn:
     """With low probability, prepend a natural filler phrase."""
     if rng.random() > _FILLER_INJECTION_PROB:
         return turn
 
-    fillers = _HOST_FILLERS if turn.speaker == "HOST" else _EXPERT_FILLERS
-    filler = rng.choice(fillers)
+    host = turn.speaker == "HOST"
+    filler = rng.choice(_HOST_FILLERS if host else _EXPERT_FILLERS)
 
     # Don't double-inject if the text already starts with a filler
-    if any(turn.text.lower().startswith(f.lower().rstrip(",. ")) for f in fillers):
+    prefixes = _FILLER_PREFIXES["HOST" if host else "EXPERT"]
+    if turn.text[:_FILLER_PREFIX_LEN].lower().startswith(prefixes):
         return turn
 
     # Some fillers are sentence starters, some are interjections
@@ -179,31 +238,19 @@ def _maybe_inject_filler(turn: Turn, rng: random.Random) -> Turn:
 
 
 def _parse_dialogue_block(text: str) -> list[Turn]:
-    """Parse a block of dialogue text into a list of Turn objects."""
-    turns: list[Turn] = []
-    current_speaker: Optional[str] = None
-    current_lines: list[str] = []
-
-    for line in text.split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-
-        parsed = _normalise_speaker(line)
-        if parsed:
-            # Flush previous turn
-            if current_speaker and current_lines:
-                turns.append(Turn(speaker=current_speaker, text=" ".join(current_lines)))
-            current_speaker, first_text = parsed
-            current_lines = [first_text] if first_text else []
-        elif current_speaker:
-            # Continuation line of current speaker
-            current_lines.append(line)
-
-    # Flush last turn
-    if current_speaker and current_lines:
-        turns.append(Turn(speaker=current_speaker, text=" ".join(current_lines)))
+    """
+    Parse a block of dialogue text into a list of Turn objects.
 
+    One split on the speaker labels yields ``[preamble, label, body,
+    label, body, …]``; text before the first label is dropped and each
+    body's non-blank lines are stripped and joined with single spaces.
+    """
+    parts = _SPEAKER_RE.split(text)
+    turns: list[Turn] = []
+    for label, body in zip(parts[1::2], parts[2::2]):
+        body = " ".join(filter(None, map(str.strip, body.split("\n"))))
+        if body:
+            turns.append(Turn(speaker=_SPEAKER_ROLES.get(label.upper(), "EXPERT"), text=body))
     return turns
 
 
@@ -229,9 +276,6 @@ def post_process(script: FullScript, seed: int = 42) -> ProcessedScript:
 
     # ── Intro ────────────────────────────────────────────────
     intro_turns = _parse_dialogue_block(script.intro)
-    for t in intro_turns:
-        t.text = _clean_turn_text(t.text)
-        t = _maybe_inject_filler(t, rng)
     if intro_turns:
         segment_markers[0] = "Introduction"
     all_turns.extend(intro_turns)
@@ -239,22 +283,22 @@ def post_process(script: FullScript, seed: int = 42) -> ProcessedScript:
     # ── Section segments ─────────────────────────────────────
     for seg in script.segments:
         seg_turns = _parse_dialogue_block(seg.raw_dialogue)
-        for t in seg_turns:
-            t.text = _clean_turn_text(t.text)
-            t = _maybe_inject_filler(t, rng)
-
         if seg_turns:
             segment_markers[len(all_turns)] = seg.section_title
         all_turns.extend(seg_turns)
 
     # ── Outro ────────────────────────────────────────────────
+    outro_start = len(all_turns)
     outro_turns = _parse_dialogue_block(script.outro)
-    for t in outro_turns:
-        t.text = _clean_turn_text(t.text)
     if outro_turns:
-        segment_markers[len(all_turns)] = "Closing"
+        segment_markers[outro_start] = "Closing"
     all_turns.extend(outro_turns)
 
+    # ── Clean, then add fillers (none in the closing) ────────
+    _clean_turn_texts(all_turns)
+    for t in all_turns[:outro_start]:
+        _maybe_inject_filler(t, rng)
+
     # ── Filter empty turns ───────────────────────────────────
     all_turns = [t for t in all_turns if t.text.strip()]
 
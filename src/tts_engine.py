@@ -6,21 +6,29 @@ Supports three engines:
   • edge-tts    (Microsoft Edge TTS, free, high-quality, async)
   • Coqui TTS   (local VITS model, fully offline, CPU-friendly)
 
-Generates one audio clip per dialogue turn, then concatenates them
-with configurable silence gaps using pydub. Exports a single MP3.
+Generates one audio clip per dialogue turn, then streams them into a
+single file with configurable silence gaps, in ``settings.AUDIO_FORMAT``.
 """
 
 from __future__ import annotations
 
 import asyncio
-import gc
+import hashlib
+import io
 import logging
+import os
+import re
 import shutil
+import struct
 import subprocess
 import tempfile
+import threading
 import time
+import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Optional
 
 from pydub import AudioSegment
 
@@ -32,12 +40,130 @@ try:
 except ImportError:
     pass  # Fall back to system ffmpeg if imageio-ffmpeg not installed
 
-import config
+# PyAV decodes mp3 clips in-process; without it they are transcoded
+# through the ffmpeg binary above.
+try:
+    import av
+except ImportError:
+    av = None
+
+from config import settings
 from src.post_processor import ProcessedScript, Turn
 
 logger = logging.getLogger(__name__)
 
 
+def _build_silence_wav(ms: int, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(sample_rate)
+        wav.writeframes(bytes(sample_rate * ms // 1000 * channels * sample_width))
+    return buf.getvalue()
+
+
+# Placeholder written for a turn every engine failed on.  Same format as
+# ``AudioSegment.silent`` so concatenation settles on the same output rate.
+_SILENCE_WAV_BYTES = _build_silence_wav(500, 11025)
+
+
+_PROGRESS_MIN_INTERVAL = 0.1  # seconds between per-turn progress updates
+
+
+def _throttle(
+    progress_cb: Optional[Callable[[str, float], None]],
+) -> Callable[[str, float, bool], None]:
+    """
+    Wrap *progress_cb* so per-turn updates arriving within
+    ``_PROGRESS_MIN_INTERVAL`` of the last one are dropped; the final
+    update (``last=True``) is always delivered.
+    """
+    sent_at = float("-inf")
+
+    def report(message: str, fraction: float, last: bool = False) -> None:
+        nonlocal sent_at
+        if progress_cb is None:
+            return
+        now = time.monotonic()
+        if last or now - sent_at >= _PROGRESS_MIN_INTERVAL:
+            sent_at = now
+            progress_cb(message, fraction)
+
+    return report
+
+
+# ─────────────────────────────────────────────
+# Clip cache (keyed by engine, voice and text)
+# ─────────────────────────────────────────────
+
+def _tts_cache_path(engine: str, voice: str, text: str, suffix: str) -> Path:
+    key = hashlib.blake2b(f"{engine}|{voice}|{text}".encode(), digest_size=16).hexdigest()
+    return settings.TTS_CACHE_DIR / f"{key}{suffix}"
+
+
+def _tts_cache_get(engine: str, voice: str, text: str, out_path: Path) -> Optional[Path]:
+    """
+    Copy the cached clip for this utterance next to *out_path* and return
+    the copy, or None on a miss (or any error reading the cache).  Callers
+    get their own copy, so eviction and decoding never touch cache files.
+    """
+    if not settings.TTS_CACHE_ENABLED:
+        return None
+    for suffix in (".wav", ".mp3"):
+        path = _tts_cache_path(engine, voice, text, suffix)
+        clip = out_path.with_suffix(suffix)
+        try:
+            shutil.copyfile(path, clip)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            # Unreadable entry, disk full … — synthesize instead; a lookup
+            # never fails a turn.
+            logger.warning("Could not read cached TTS clip: %s", exc)
+            clip.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass  # evicted by another run since the copy, which is whole
+        return clip
+    return None
+
+
+def _tts_cache_put(engine: str, voice: str, text: str, clip: Path) -> None:
+    """Copy a freshly synthesized clip into the cache (never raises)."""
+    if not settings.TTS_CACHE_ENABLED:
+        return
+    path = _tts_cache_path(engine, voice, text, clip.suffix)
+    # Copy-then-rename so a concurrent reader never sees a partial clip
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        settings.TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(clip, tmp)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Could not cache TTS clip: %s", exc)
+        tmp.unlink(missing_ok=True)
+
+
+def _prune_tts_cache() -> None:
+    """Evict least recently used clips until the cache fits ``TTS_CACHE_MAX_MB``."""
+    if not settings.TTS_CACHE_ENABLED:
+        return
+    try:
+        entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                   for e in os.scandir(settings.TTS_CACHE_DIR) if e.is_file()]
+    except FileNotFoundError:
+        return
+    excess = sum(size for _, size, _ in entries) - settings.TTS_CACHE_MAX_MB * 1024 * 1024
+    for _, size, path in sorted(entries):
+        if excess <= 0:
+            break
+        Path(path).unlink(missing_ok=True)
+        excess -= size
+
+
 # ─────────────────────────────────────────────
 # Groq TTS backend with auto-fallback to edge-tts
 # ─────────────────────────────────────────────
@@ -45,54 +171,58 @@ logger = logging.getLogger(__name__)
 # Retry config for transient (per-minute) rate limits
 _GROQ_TTS_MAX_RETRIES = 3
 _GROQ_TTS_RETRY_BASE_DELAY = 5  # seconds
+_GROQ_TTS_MAX_RETRY_AFTER = 60  # longer server-requested waits fall back to backoff
 
 
-def _is_daily_limit(exc: Exception) -> bool:
-    """Return True if the error is a daily (TPD) rate limit — not worth retrying."""
-    msg = str(exc).lower()
-    return "tokens per day" in msg or "tpd" in msg
+_DAILY_LIMIT_RE = re.compile(r"tokens per day|tpd", re.I)
 
 
-def _get_groq_voice(speaker: str) -> str:
-    """Map speaker label to a Groq / PlayAI voice name."""
-    if speaker == "HOST":
-        return config.GROQ_VOICE_HOST
-    return config.GROQ_VOICE_EXPERT
+def _is_rate_limit(exc: Exception) -> bool:
+    """Return True for a 429, read off the SDK error's status when it has one."""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429
+    msg = str(exc)
+    return "429" in msg or "rate_limit" in msg.lower()
 
 
-def _edge_fallback_single(turn: Turn, out_path: Path) -> Path:
-    """Synthesize a single turn via edge-tts (sync wrapper)."""
-    import edge_tts
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited request: the server's
+    ``Retry-After`` when it sends a reasonable one, else exponential backoff.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        retry_after = float(headers.get("retry-after", ""))
+    except ValueError:
+        retry_after = -1.0  # absent, or an HTTP date
+    if 0 <= retry_after < _GROQ_TTS_MAX_RETRY_AFTER:
+        return retry_after + 0.1
+    return _GROQ_TTS_RETRY_BASE_DELAY * (2 ** attempt)
 
-    voice = _get_edge_voice(turn.speaker)
-    communicate = edge_tts.Communicate(turn.text, voice)
 
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        import nest_asyncio
-        nest_asyncio.apply()
-        asyncio.get_event_loop().run_until_complete(communicate.save(str(out_path)))
-    else:
-        asyncio.run(communicate.save(str(out_path)))
+def _is_daily_limit(exc: Exception) -> bool:
+    """Return True if the error is a daily (TPD) rate limit — not worth retrying."""
+    return _DAILY_LIMIT_RE.search(str(exc)) is not None
 
-    return out_path
 
+_GROQ_VOICES = {"HOST": settings.GROQ_VOICE_HOST, "EXPERT": settings.GROQ_VOICE_EXPERT}
 
-def _generate_groq_clips(
-    turns: list[Turn],
-    tmp_dir: Path,
-    progress_cb: Optional[Callable[[str, float], None]] = None,
-) -> list[Path]:
-    """
-    Generate one WAV per turn using Groq's TTS API.
 
-    If a per-minute (RPM/TPM) rate limit is hit, retries with exponential
-    backoff.  If the daily token limit (TPD) is exhausted, automatically
-    falls back to edge-tts for the remaining turns.
+def _get_groq_voice(speaker: str) -> str:
+    """Map speaker label to a Groq / PlayAI voice name (unknown → expert)."""
+    return _GROQ_VOICES.get(speaker, settings.GROQ_VOICE_EXPERT)
+
+
+@lru_cache(maxsize=1)
+def _groq_tts_client():
+    """
+    Build the Groq client once per process.  Its connection pool then
+    outlives a single run, so later runs reuse warm TLS connections.
+    SDK retries are off: _groq_tts_turn does its own, and a daily-limit
+    429 has to reach it at once to switch to edge-tts.
     """
     try:
         from groq import Groq
@@ -100,126 +230,188 @@ def _generate_groq_clips(
         raise ImportError(
             "Install the groq package:  pip install groq"
         )
+    return Groq(api_key=settings.GROQ_API_KEY, max_retries=0)
 
-    client = Groq(api_key=config.GROQ_API_KEY)
-    clips: list[Path] = []
-    total = len(turns)
-    use_edge_fallback = False  # flip once on daily-limit hit
 
-    for idx, turn in enumerate(turns):
-        out_path = tmp_dir / f"turn_{idx:04d}.wav"
+def _edge_fallback_single(turn: Turn, out_path: Path) -> Path:
+    """
+    Synthesize a single turn via edge-tts (sync wrapper); returns the clip
+    path.  Only called from Groq's worker threads, which have no loop.
+    """
+    return asyncio.run(
+        _edge_tts_synthesize(turn.text, _get_edge_voice(turn.speaker), out_path)
+    )
 
-        # ── If daily limit already hit, go straight to edge-tts ──
-        if use_edge_fallback:
-            try:
-                # edge-tts produces mp3
-                edge_path = tmp_dir / f"turn_{idx:04d}.mp3"
-                _edge_fallback_single(turn, edge_path)
-                clips.append(edge_path)
-            except Exception as edge_exc:
-                logger.warning("Edge-tts fallback failed on turn %d: %s", idx, edge_exc)
-                silence = AudioSegment.silent(duration=500)
-                silence.export(str(out_path), format="wav")
-                clips.append(out_path)
-
-            if progress_cb:
-                progress_cb(f"TTS (edge fallback): turn {idx + 1}/{total}", idx / total)
-            continue
 
-        # ── Try Groq with retries for transient rate limits ──
-        success = False
-        for attempt in range(_GROQ_TTS_MAX_RETRIES):
-            try:
-                voice = _get_groq_voice(turn.speaker)
-                response = client.audio.speech.create(
-                    model=config.GROQ_TTS_MODEL,
-                    input=turn.text,
-                    voice=voice,
-                    response_format="wav",
-                )
-                response.write_to_file(str(out_path))
-                clips.append(out_path)
-                success = True
-                break
-            except Exception as exc:
-                if "429" in str(exc) or "rate_limit" in str(exc).lower():
-                    if _is_daily_limit(exc):
-                        # Daily quota exhausted → switch all remaining to edge-tts
+def _groq_tts_turn(
+    client,
+    turn: Turn,
+    idx: int,
+    tmp_dir: Path,
+    daily_limit: threading.Event,
+    report_wait: Callable[[str], None],
+) -> Path:
+    """
+    Synthesize one turn with Groq, falling back to edge-tts (and to a short
+    silence if that fails too).  *daily_limit* is shared by every turn: it
+    is set on the first daily-limit hit so the rest skip Groq entirely.
+    *report_wait* surfaces a rate-limit pause in the progress UI.
+    """
+    out_path = tmp_dir / f"turn_{idx:04d}.wav"
+    engine = f"groq/{settings.GROQ_TTS_MODEL}"
+    voice = _get_groq_voice(turn.speaker)
+    cached = _tts_cache_get(engine, voice, turn.text, out_path)
+    if cached is not None:
+        return cached
+
+    # ── Try Groq with retries for transient rate limits ──
+    for attempt in range(_GROQ_TTS_MAX_RETRIES):
+        if daily_limit.is_set():
+            break  # another turn used up the day's quota, maybe mid-backoff
+        try:
+            response = client.audio.speech.create(
+                model=settings.GROQ_TTS_MODEL,
+                input=turn.text,
+                voice=voice,
+                response_format="wav",
+            )
+            response.write_to_file(str(out_path))
+            _tts_cache_put(engine, voice, turn.text, out_path)
+            return out_path
+        except Exception as exc:
+            if _is_rate_limit(exc):
+                if _is_daily_limit(exc):
+                    # Daily quota exhausted → switch all remaining to edge-tts
+                    if not daily_limit.is_set():
                         logger.warning(
                             "Groq TTS daily limit reached at turn %d. "
                             "Falling back to edge-tts for remaining turns.",
                             idx,
                         )
-                        use_edge_fallback = True
-                        break
-                    else:
-                        # Per-minute limit → wait and retry
-                        delay = _GROQ_TTS_RETRY_BASE_DELAY * (2 ** attempt)
-                        logger.info(
-                            "Groq TTS rate-limited (RPM/TPM) on turn %d, "
-                            "retrying in %ds (attempt %d/%d)…",
-                            idx, delay, attempt + 1, _GROQ_TTS_MAX_RETRIES,
-                        )
-                        if progress_cb:
-                            progress_cb(
-                                f"Rate limited — waiting {delay}s before retry…",
-                                idx / total,
-                            )
-                        time.sleep(delay)
-                else:
-                    # Non-rate-limit error → fall back immediately
-                    logger.warning("Groq TTS failed on turn %d: %s", idx, exc)
+                    daily_limit.set()
                     break
-
-        # If Groq didn't succeed (retries exhausted or daily limit), use edge-tts
-        if not success:
-            if use_edge_fallback:
-                # Daily limit just triggered on this turn — handle it via edge
-                try:
-                    edge_path = tmp_dir / f"turn_{idx:04d}.mp3"
-                    _edge_fallback_single(turn, edge_path)
-                    clips.append(edge_path)
-                except Exception as edge_exc:
-                    logger.warning("Edge-tts fallback failed on turn %d: %s", idx, edge_exc)
-                    silence = AudioSegment.silent(duration=500)
-                    silence.export(str(out_path), format="wav")
-                    clips.append(out_path)
+                else:
+                    # Per-minute limit → wait and retry
+                    delay = _retry_delay(exc, attempt)
+                    logger.info(
+                        "Groq TTS rate-limited (RPM/TPM) on turn %d, "
+                        "retrying in %.1fs (attempt %d/%d)…",
+                        idx, delay, attempt + 1, _GROQ_TTS_MAX_RETRIES,
+                    )
+                    report_wait(f"Rate limited — waiting {delay:.0f}s before retry…")
+                    time.sleep(delay)
             else:
-                # Transient failure — try edge as one-off fallback
-                try:
-                    edge_path = tmp_dir / f"turn_{idx:04d}.mp3"
-                    _edge_fallback_single(turn, edge_path)
-                    clips.append(edge_path)
-                    logger.info("Used edge-tts fallback for turn %d", idx)
-                except Exception:
-                    silence = AudioSegment.silent(duration=500)
-                    silence.export(str(out_path), format="wav")
-                    clips.append(out_path)
+                # Non-rate-limit error → fall back immediately
+                logger.warning("Groq TTS failed on turn %d: %s", idx, exc)
+                break
+
+    # Groq didn't succeed (daily limit, retries exhausted or an error)
+    try:
+        # edge-tts produces mp3
+        edge_path = _edge_fallback_single(turn, tmp_dir / f"turn_{idx:04d}.mp3")
+        if not daily_limit.is_set():
+            logger.info("Used edge-tts fallback for turn %d", idx)
+        return edge_path
+    except Exception as edge_exc:
+        logger.warning("Edge-tts fallback failed on turn %d: %s", idx, edge_exc)
+        out_path.write_bytes(_SILENCE_WAV_BYTES)
+        return out_path
+
 
+def _generate_groq_clips(
+    turns: list[Turn],
+    tmp_dir: Path,
+    progress_cb: Optional[Callable[[str, float], None]] = None,
+) -> list[Path]:
+    """
+    Generate one WAV per turn using Groq's TTS API.
+
+    Turns are synthesized concurrently (bounded by
+    ``settings.GROQ_TTS_CONCURRENCY``) and returned in script order.
+    If a per-minute (RPM/TPM) rate limit is hit, retries with exponential
+    backoff.  If the daily token limit (TPD) is exhausted, automatically
+    falls back to edge-tts for the remaining turns.
+    """
+    client = _groq_tts_client()
+    total = len(turns)
+    if not total:
+        return []
+    clips: dict[int, Path] = {}
+    daily_limit = threading.Event()  # set once on daily-limit hit
+
+    report = _throttle(progress_cb)
+    done = 0  # turns finished so far
+
+    def report_wait(message: str) -> None:
+        # Hold the bar where the finished turns put it
         if progress_cb:
-            label = "TTS (edge fallback)" if use_edge_fallback else "TTS"
-            progress_cb(f"{label}: turn {idx + 1}/{total}", idx / total)
+            progress_cb(message, max(done - 1, 0) / total)
+
+    workers = min(settings.GROQ_TTS_CONCURRENCY, total)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                _groq_tts_turn, client, turn, idx, tmp_dir, daily_limit, report_wait,
+            ): idx
+            for idx, turn in enumerate(turns)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            clips[futures[future]] = future.result()
+            label = "TTS (edge fallback)" if daily_limit.is_set() else "TTS"
+            report(f"{label}: turn {done}/{total}", (done - 1) / total, done == total)
 
-    return clips
+    return [clips[idx] for idx in range(total)]
 
 
 # ─────────────────────────────────────────────
 # Edge-TTS backend (async, free, high quality)
 # ─────────────────────────────────────────────
 
-async def _edge_tts_synthesize(text: str, voice: str, out_path: Path) -> None:
-    """Synthesize a single utterance with edge-tts."""
+async def _edge_tts_synthesize(text: str, voice: str, out_path: Path) -> Path:
+    """
+    Synthesize a single utterance with edge-tts and return the clip path.
+    Both the edge engine and the Groq fallback go through here.
+
+    edge-tts always produces mp3 (the format is fixed inside the library).
+    The clip is decoded to a WAV next to *out_path* straight away, off the
+    event loop, so decoding overlaps the other turns' network waits and
+    concatenation, which can't start until every clip's format is known,
+    is left with WAV headers to read.
+
+    Each call opens its own WebSocket: edge-tts creates the connection
+    inside ``Communicate`` and its session closes any connector handed
+    in, so connections cannot be pooled.  Callers overlap the handshakes
+    by running turns concurrently instead.
+    """
     import edge_tts
 
+    cached = _tts_cache_get("edge", voice, text, out_path)
+    if cached is not None:
+        return cached
+
     communicate = edge_tts.Communicate(text, voice)
     await communicate.save(str(out_path))
+    out_path = await asyncio.to_thread(_mp3_to_wav, out_path)
+    _tts_cache_put("edge", voice, text, out_path)
+    return out_path
+
+
+def _mp3_to_wav(path: Path) -> Path:
+    wav_path = path.with_suffix(".wav")
+    if av is not None:
+        _export(_decode_with_av(path), wav_path)
+    else:
+        _ffmpeg_to_wav(path, wav_path)
+    path.unlink(missing_ok=True)
+    return wav_path
+
+
+_EDGE_VOICES = {"HOST": settings.EDGE_VOICE_HOST, "EXPERT": settings.EDGE_VOICE_EXPERT}
 
 
 def _get_edge_voice(speaker: str) -> str:
-    """Map speaker label to an edge-tts voice name."""
-    if speaker == "HOST":
-        return config.EDGE_VOICE_HOST
-    return config.EDGE_VOICE_EXPERT
+    """Map speaker label to an edge-tts voice name (unknown → expert)."""
+    return _EDGE_VOICES.get(speaker, settings.EDGE_VOICE_EXPERT)
 
 
 async def _generate_edge_clips(
@@ -227,129 +419,373 @@ async def _generate_edge_clips(
     tmp_dir: Path,
     progress_cb: Optional[Callable[[str, float], None]] = None,
 ) -> list[Path]:
-    """Generate one MP3 per turn using edge-tts."""
-    clips: list[Path] = []
+    """
+    Generate one MP3 per turn using edge-tts.  Turns are synthesized
+    concurrently (bounded by ``settings.EDGE_TTS_CONCURRENCY``) and
+    returned in script order.
+    """
     total = len(turns)
+    sem = asyncio.Semaphore(settings.EDGE_TTS_CONCURRENCY)
+    report = _throttle(progress_cb)
+    done = 0
 
-    for idx, turn in enumerate(turns):
+    async def _one(idx: int, turn: Turn) -> Path:
+        nonlocal done
         out_path = tmp_dir / f"turn_{idx:04d}.mp3"
         voice = _get_edge_voice(turn.speaker)
 
-        try:
-            await _edge_tts_synthesize(turn.text, voice, out_path)
-            clips.append(out_path)
-        except Exception as exc:
-            logger.warning("edge-tts failed on turn %d: %s", idx, exc)
-            # Create a short silence as placeholder (wav needs no ffmpeg)
-            out_path = tmp_dir / f"turn_{idx:04d}.wav"
-            silence = AudioSegment.silent(duration=500)
-            silence.export(str(out_path), format="wav")
-            clips.append(out_path)
+        async with sem:
+            try:
+                out_path = await _edge_tts_synthesize(turn.text, voice, out_path)
+            except Exception as exc:
+                logger.warning("edge-tts failed on turn %d: %s", idx, exc)
+                # Short silence as placeholder so the episode keeps its timing
+                out_path = tmp_dir / f"turn_{idx:04d}.wav"
+                out_path.write_bytes(_SILENCE_WAV_BYTES)
 
-        if progress_cb:
-            progress_cb(f"TTS: turn {idx + 1}/{total}", idx / total)
+        done += 1
+        report(f"TTS: turn {done}/{total}", (done - 1) / total, done == total)
+        return out_path
 
-    return clips
+    return list(await asyncio.gather(*(_one(idx, turn) for idx, turn in enumerate(turns))))
 
 
 # ─────────────────────────────────────────────
 # Coqui TTS backend (offline, CPU)
 # ─────────────────────────────────────────────
 
-def _generate_coqui_clips(
-    turns: list[Turn],
-    tmp_dir: Path,
-    progress_cb: Optional[Callable[[str, float], None]] = None,
-) -> list[Path]:
-    """Generate one WAV per turn using Coqui TTS (VITS model)."""
+@lru_cache(maxsize=1)
+def _coqui_model():
+    """Load the Coqui model once per process; every run reuses it."""
     try:
         from TTS.api import TTS as CoquiTTS
     except ImportError:
         raise ImportError(
             "Coqui TTS is not installed. Install it with: pip install TTS"
         )
+    return CoquiTTS(model_name=settings.COQUI_MODEL_NAME, progress_bar=False)
 
-    tts = CoquiTTS(model_name=config.COQUI_MODEL_NAME, progress_bar=False)
-    clips: list[Path] = []
-    total = len(turns)
 
-    for idx, turn in enumerate(turns):
-        out_path = tmp_dir / f"turn_{idx:04d}.wav"
+def _coqui_tts_turn(tts, turn: Turn, idx: int, tmp_dir: Path) -> Path:
+    out_path = tmp_dir / f"turn_{idx:04d}.wav"
+    cached = _tts_cache_get("coqui", settings.COQUI_MODEL_NAME, turn.text, out_path)
+    if cached is not None:
+        return cached
+    try:
+        tts.tts_to_file(text=turn.text, file_path=str(out_path))
+        _tts_cache_put("coqui", settings.COQUI_MODEL_NAME, turn.text, out_path)
+    except Exception as exc:
+        logger.warning("Coqui TTS failed on turn %d: %s", idx, exc)
+        out_path.write_bytes(_SILENCE_WAV_BYTES)
+    return out_path
+
 
-        try:
-            tts.tts_to_file(text=turn.text, file_path=str(out_path))
-            clips.append(out_path)
-        except Exception as exc:
-            logger.warning("Coqui TTS failed on turn %d: %s", idx, exc)
-            silence = AudioSegment.silent(duration=500)
-            silence.export(str(out_path), format="wav")
-            clips.append(out_path)
+def _generate_coqui_clips(
+    turns: list[Turn],
+    tmp_dir: Path,
+    progress_cb: Optional[Callable[[str, float], None]] = None,
+) -> list[Path]:
+    """
+    Generate one WAV per turn using Coqui TTS (VITS model).
 
-        if progress_cb:
-            progress_cb(f"TTS: turn {idx + 1}/{total}", idx / total)
+    With ``settings.COQUI_TTS_WORKERS`` > 1, turns are synthesized on that
+    many threads sharing the one model (PyTorch releases the GIL while it
+    computes) and returned in script order.
+    """
+    tts = _coqui_model()
+    total = len(turns)
+    if not total:
+        return []
+    clips: dict[int, Path] = {}
+
+    report = _throttle(progress_cb)
+
+    workers = min(settings.COQUI_TTS_WORKERS, total)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_coqui_tts_turn, tts, turn, idx, tmp_dir): idx
+            for idx, turn in enumerate(turns)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            clips[futures[future]] = future.result()
+            report(f"TTS: turn {done}/{total}", (done - 1) / total, done == total)
 
-    return clips
+    return [clips[idx] for idx in range(total)]
 
 
 # ─────────────────────────────────────────────
 # Concatenation
 # ─────────────────────────────────────────────
 
+def _decode_with_av(path: Path) -> AudioSegment:
+    """Decode a compressed clip in memory with PyAV, as 16-bit PCM."""
+    resampler = av.AudioResampler(format="s16")  # keeps rate and channels
+    with av.open(str(path)) as container:
+        decoded = list(container.decode(audio=0))
+    # A trailing None flushes the resampler
+    frames = [out for frame in decoded + [None] for out in resampler.resample(frame)]
+    if not frames:
+        raise ValueError(f"No audio decoded from {path.name}")
+    channels = len(frames[0].layout.channels)
+    # Packed s16 keeps every channel in plane 0, which may be padded
+    return AudioSegment(
+        data=b"".join(
+            bytes(frame.planes[0])[: frame.samples * channels * 2] for frame in frames
+        ),
+        sample_width=2,
+        frame_rate=frames[0].sample_rate,
+        channels=channels,
+    )
+
+
+def _ffmpeg_to_wav(path: Path, wav_path: Path) -> None:
+    """Transcode a clip to WAV with the ffmpeg binary pydub is pointed at."""
+    ffmpeg_bin = getattr(AudioSegment, "converter", "ffmpeg")
+    subprocess.run(
+        [ffmpeg_bin, "-y", "-i", str(path), str(wav_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+
+
+# pydub leaves files it opens itself (and the handle export() returns)
+# for the garbage collector to close, which on Windows blocks removing the
+# temp dir; these helpers hand it file objects whose lifetime is ours.
+
+def _read_wav(path: Path) -> AudioSegment:
+    with open(path, "rb") as f:
+        return AudioSegment.from_wav(f)
+
+
+def _export(segment: AudioSegment, path: Path, format: str = "wav") -> None:
+    with open(path, "wb") as f:
+        segment.export(f, format=format)
+
+
 def _load_clip(path: Path) -> AudioSegment:
     """
     Load an audio clip without relying on ffprobe.
 
     * .wav  → read directly via Python's wave module (no external tools).
-    * .mp3  → convert to .wav with the bundled ffmpeg, then read the wav.
+    * .mp3  → decode in-process with PyAV when installed; otherwise
+      convert to .wav with the bundled ffmpeg, then read the wav.
     """
     if path.suffix == ".wav":
-        return AudioSegment.from_wav(str(path))
+        return _read_wav(path)
+
+    if av is not None:
+        return _decode_with_av(path)
 
     # mp3 or other format → transcode to wav via ffmpeg subprocess
-    ffmpeg_bin = getattr(AudioSegment, "converter", "ffmpeg")
     wav_path = path.with_suffix(".wav")
-    subprocess.run(
-        [ffmpeg_bin, "-y", "-i", str(path), str(wav_path)],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        check=True,
-    )
-    segment = AudioSegment.from_wav(str(wav_path))
+    _ffmpeg_to_wav(path, wav_path)
+    segment = _read_wav(wav_path)
     wav_path.unlink(missing_ok=True)
     return segment
 
 
+def _wav_format(path: Path) -> Optional[tuple[int, int, int]]:
+    """
+    ``(channels, frame_rate, sample_width)`` from a WAV header alone, or
+    None when the clip needs a full load to tell (non-PCM or 24-bit, which
+    pydub widens to 32-bit, or a header the wave module can't parse).
+    """
+    try:
+        with wave.open(str(path), "rb") as wav:
+            if wav.getsampwidth() == 3:
+                return None
+            return wav.getnchannels(), wav.getframerate(), wav.getsampwidth()
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+# Canonical 44-byte PCM header, as the wave module writes it
+_WAV_HEADER = struct.Struct("<4sL4s4sLHHLLHH4sL")
+
+
+def _wav_data_span(f) -> tuple[int, int]:
+    """Offset and declared length of the ``data`` chunk in an open WAV file."""
+    f.seek(12)  # past RIFF <size> WAVE
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            raise EOFError("WAV file has no data chunk")
+        chunk_id, size = struct.unpack("<4sL", head)
+        if chunk_id == b"data":
+            return f.tell(), size
+        f.seek(size + (size & 1), os.SEEK_CUR)  # chunks are word-aligned
+
+
+def _append_wav_data(path: Path, out) -> int:
+    """
+    Append a WAV clip's samples to the unbuffered file *out* without
+    decoding them — in the kernel via ``copy_file_range`` where the
+    platform has it, else through a read/write loop.  Returns bytes copied.
+    """
+    with open(path, "rb", buffering=0) as src:
+        offset, remaining = _wav_data_span(src)
+        src.seek(offset)
+        copied = 0
+        kernel_copy = hasattr(os, "copy_file_range")
+        while remaining:
+            n = 0
+            if kernel_copy:
+                try:
+                    n = os.copy_file_range(src.fileno(), out.fileno(), remaining)
+                except OSError:
+                    kernel_copy = False  # e.g. across filesystems on older kernels
+                    continue
+                if not n and not copied:
+                    kernel_copy = False  # some filesystems report 0 instead of failing
+                    continue
+            else:
+                chunk = memoryview(src.read(min(remaining, 1 << 20)))
+                n = len(chunk)
+                while chunk:
+                    chunk = chunk[out.write(chunk):]  # unbuffered writes may be short
+            if not n:
+                break  # file shorter than its header claims
+            copied += n
+            remaining -= n
+    return copied
+
+
 def _concatenate_clips(
     clip_paths: list[Path],
     output_path: Path,
-    silence_ms: int = config.SILENCE_BETWEEN_TURNS_MS,
+    silence_ms: int = settings.SILENCE_BETWEEN_TURNS_MS,
 ) -> Path:
     """
     Concatenate audio clips with silence gaps between them.
     Returns the path to the final audio file.
-    """
-    silence = AudioSegment.silent(duration=silence_ms)
-    combined = AudioSegment.empty()
 
+    Clips are decoded one at a time and their PCM streamed into a WAV
+    file, so memory holds one clip rather than the whole episode; clips
+    already in the output format are copied across without decoding.
+    Other output formats are then encoded from that WAV by ffmpeg.
+    """
+    # First pass: find each clip's format — from the header alone for
+    # plain WAVs, otherwise by decoding (non-WAV clips are written to a
+    # WAV alongside, so the second pass doesn't decode them again)
+    clips: list[tuple[Path, Optional[tuple[int, int, int]]]] = []
+    channels = frame_rate = 0
+    sample_width = 2  # 8-bit WAV is unsigned; 16-bit PCM is written as is
     for path in clip_paths:
-        try:
-            segment = _load_clip(path)
-            if len(combined) > 0:
-                combined += silence
-            combined += segment
-        except Exception as exc:
-            logger.warning("Skipping clip %s: %s", path.name, exc)
+        header = fmt = _wav_format(path) if path.suffix == ".wav" else None
+        if fmt is None:
+            try:
+                segment = _load_clip(path)
+            except Exception as exc:
+                logger.warning("Skipping clip %s: %s", path.name, exc)
+                continue
+            if path.suffix != ".wav":
+                path = path.with_name(f"{path.stem}.decoded.wav")
+                _export(segment, path)
+            fmt = (segment.channels, segment.frame_rate, segment.sample_width)
+        clips.append((path, header))
+        # Convert everything to the format pydub's `+` would settle on
+        channels = max(channels, fmt[0])
+        frame_rate = max(frame_rate, fmt[1])
+        sample_width = max(sample_width, fmt[2])
+
+    def _pcm(segment: AudioSegment) -> bytes:
+        return (
+            segment.set_channels(channels)
+            .set_frame_rate(frame_rate)
+            .set_sample_width(sample_width)
+            .raw_data
+        )
 
-    combined.export(str(output_path), format=config.AUDIO_FORMAT)
-    logger.info("Exported audio: %s (%.1f sec)", output_path, len(combined) / 1000)
+    if not clips:
+        _export(AudioSegment.empty(), output_path, settings.AUDIO_FORMAT)
+        logger.info("Exported audio: %s (0.0 sec)", output_path)
+        return output_path
+
+    encode = settings.AUDIO_FORMAT != "wav"
+    wav_path = output_path.with_suffix(".partial.wav") if encode else output_path
+    silence = _pcm(AudioSegment.silent(duration=silence_ms))
+    frame_size = channels * sample_width
+    written = 0
+    with open(wav_path, "wb", buffering=0) as out:
+        out.write(bytes(_WAV_HEADER.size))  # filled in once the length is known
+        for i, (path, header) in enumerate(clips):
+            if i:
+                written += out.write(silence)
+            if header == (channels, frame_rate, sample_width):
+                written += _append_wav_data(path, out)
+            else:
+                written += out.write(_pcm(_read_wav(path)))
+        out.seek(0)
+        out.write(_WAV_HEADER.pack(
+            b"RIFF", 36 + written, b"WAVE", b"fmt ", 16, 1, channels, frame_rate,
+            frame_rate * frame_size, frame_size, sample_width * 8, b"data", written,
+        ))
+    seconds = written // frame_size / frame_rate
+
+    if encode:
+        ffmpeg_bin = getattr(AudioSegment, "converter", "ffmpeg")
+        try:
+            subprocess.run(
+                [ffmpeg_bin, "-y", "-i", str(wav_path), str(output_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+        finally:
+            wav_path.unlink(missing_ok=True)
+
+    logger.info("Exported audio: %s (%.1f sec)", output_path, seconds)
     return output_path
 
 
+# ─────────────────────────────────────────────
+# Engine registry
+# ─────────────────────────────────────────────
+
+ClipGenerator = Callable[
+    [list[Turn], Path, Optional[Callable[[str, float], None]]], Awaitable[list[Path]]
+]
+
+
+def _in_thread(generate: Callable[..., list[Path]]) -> ClipGenerator:
+    """Adapt a blocking clip generator so it runs off the event loop."""
+    async def run(turns, tmp_dir, progress_cb):
+        return await asyncio.to_thread(generate, turns, tmp_dir, progress_cb)
+    return run
+
+
+# engine name → coroutine producing one clip per turn, in script order
+_ENGINES: dict[str, ClipGenerator] = {
+    "groq": _in_thread(_generate_groq_clips),
+    "edge": _generate_edge_clips,
+    "coqui": _in_thread(_generate_coqui_clips),
+}
+
+
 # ─────────────────────────────────────────────
 # Public API
 # ─────────────────────────────────────────────
 
-def generate_audio(
+# Each run's clips go in its own directory under one parent, so runs a
+# killed process never cleaned up can be found and swept later.
+_TMP_ROOT = Path(tempfile.gettempdir()) / "papercast_tts"
+_STALE_TMP_SECONDS = 3600
+
+
+@lru_cache(maxsize=1)
+def _sweep_stale_tmp_dirs() -> None:
+    """Remove run directories untouched for an hour (once per process)."""
+    cutoff = time.time() - _STALE_TMP_SECONDS
+    for entry in os.scandir(_TMP_ROOT):
+        try:
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+async def generate_audio_async(
     script: ProcessedScript,
     output_path: Optional[Path] = None,
     engine: Optional[str] = None,
@@ -358,6 +794,10 @@ def generate_audio(
     """
     Generate a multi-voice podcast audio file from a ProcessedScript.
 
+    For callers already running an event loop.  Blocking engines and the
+    concatenation run in worker threads so the loop stays responsive;
+    edge-tts turns run on the caller's loop directly.
+
     Parameters
     ----------
     script : ProcessedScript
@@ -365,7 +805,7 @@ def generate_audio(
     output_path : Path, optional
         Where to save the final MP3. Defaults to ``output/podcast.mp3``.
     engine : str, optional
-        ``"groq"``, ``"edge"``, or ``"coqui"``. Defaults to ``config.TTS_ENGINE``.
+        ``"groq"``, ``"edge"``, or ``"coqui"``. Defaults to ``settings.TTS_ENGINE``.
     progress_callback : callable, optional
         ``callback(stage_description, fraction_done)`` for UI updates.
 
@@ -374,46 +814,43 @@ def generate_audio(
     Path
         Path to the generated audio file.
     """
-    engine = (engine or config.TTS_ENGINE).lower()
+    engine = (engine or settings.TTS_ENGINE).lower()
+    if engine not in _ENGINES:
+        raise ValueError(
+            f"Unknown TTS engine '{engine}'. Choose from: {', '.join(_ENGINES)}"
+        )
     if output_path is None:
-        output_path = config.OUTPUT_DIR / f"podcast.{config.AUDIO_FORMAT}"
+        output_path = settings.OUTPUT_DIR / f"podcast.{settings.AUDIO_FORMAT}"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Use a manual temp dir instead of a context manager to avoid
-    # Windows file-locking issues (pydub keeps handles open).
-    tmp_dir = Path(tempfile.mkdtemp())
+    # A manual temp dir under _TMP_ROOT rather than a context manager, so
+    # cleanup ignores errors and dirs a crash leaves behind get swept later
+    _TMP_ROOT.mkdir(exist_ok=True)
+    _sweep_stale_tmp_dirs()
+    tmp_dir = Path(tempfile.mkdtemp(dir=_TMP_ROOT))
 
     try:
-        if engine == "groq":
-            clips = _generate_groq_clips(script.turns, tmp_dir, progress_callback)
-
-        elif engine == "edge":
-            # edge-tts is async — run in event loop
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop and loop.is_running():
-                # Already inside an async context (e.g. Streamlit)
-                import nest_asyncio
-                nest_asyncio.apply()
-                clips = asyncio.get_event_loop().run_until_complete(
-                    _generate_edge_clips(script.turns, tmp_dir, progress_callback)
-                )
-            else:
-                clips = asyncio.run(
-                    _generate_edge_clips(script.turns, tmp_dir, progress_callback)
-                )
-
-        elif engine == "coqui":
-            clips = _generate_coqui_clips(script.turns, tmp_dir, progress_callback)
-        else:
-            raise ValueError(f"Unknown TTS engine: {engine}. Use 'groq', 'edge', or 'coqui'.")
+        clips = await _ENGINES[engine](script.turns, tmp_dir, progress_callback)
 
         # Concatenate all clips into one file
-        result = _concatenate_clips(clips, output_path)
+        result = await asyncio.to_thread(_concatenate_clips, clips, output_path)
+        _prune_tts_cache()
         return result
     finally:
-        # Force-close any lingering file handles before cleanup
-        gc.collect()
         shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def generate_audio(
+    script: ProcessedScript,
+    output_path: Optional[Path] = None,
+    engine: Optional[str] = None,
+    progress_callback: Optional[Callable[[str, float], None]] = None,
+) -> Path:
+    """
+    Blocking wrapper around :func:`generate_audio_async` (same parameters).
+    Must not be called from a thread with a running event loop — await
+    ``generate_audio_async`` there instead.
+    """
+    return asyncio.run(
+        generate_audio_async(script, output_path, engine, progress_callback)
+    )